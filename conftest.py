@@ -0,0 +1,115 @@
+"""
+This module provides the pytest fixtures shared by the tests of shapefile.py.
+"""
+
+import io
+
+# third party imports
+import pytest
+
+# our imports
+import shapefile
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--run-network",
+        action="store_true",
+        default=False,
+        help="run the tests marked as requiring network access",
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """
+    Skips the tests marked with pytest.mark.network, unless pytest
+    was run with the --run-network option.
+    """
+    if config.getoption("--run-network"):
+        return
+    skip_network = pytest.mark.skip(reason="needs the --run-network option to run")
+    for item in items:
+        if "network" in item.keywords:
+            item.add_marker(skip_network)
+
+
+@pytest.fixture(name="blockgroups_reader", scope="session")
+def fixture_blockgroups_reader():
+    """
+    A single Reader of the shapefiles/blockgroups test data, shared by
+    all the tests that only read from it. Tests of the opening and
+    closing of files should create their own Reader instead.
+    """
+    with shapefile.Reader("shapefiles/blockgroups") as sf:
+        yield sf
+
+
+@pytest.fixture(name="blockgroups_data", scope="session")
+def fixture_blockgroups_data():
+    """
+    The contents of the shp, shx and dbf files of the shapefiles/blockgroups
+    test data, keyed by their extension and read once per test session.
+    """
+    data = {}
+    for ext in ("shp", "shx", "dbf"):
+        with open("shapefiles/blockgroups." + ext, "rb") as f:
+            data[ext] = f.read()
+    return data
+
+
+@pytest.fixture(name="blockgroups_buffers")
+def fixture_blockgroups_buffers(blockgroups_data):
+    """
+    New in memory io.BytesIO copies of the blockgroups_data for each test,
+    keyed by their extension, to read from as file-like objects.
+    """
+    return dict((ext, io.BytesIO(data)) for ext, data in blockgroups_data.items())
+
+
+@pytest.fixture(name="blockgroups_reader_no_shx")
+def fixture_blockgroups_reader_no_shx(blockgroups_buffers):
+    """
+    A new Reader of the shapefiles/blockgroups test data without its shx
+    file, for each test, reading from in memory copies of the shp and dbf.
+    """
+    shp = blockgroups_buffers["shp"]
+    dbf = blockgroups_buffers["dbf"]
+    with shapefile.Reader(shp=shp, dbf=dbf) as sf:
+        yield sf
+
+
+@pytest.fixture(name="blockgroups_shapes", scope="session")
+def fixture_blockgroups_shapes(blockgroups_reader):
+    """
+    All the shapes of the shapefiles/blockgroups test data,
+    read once per test session.
+    """
+    return blockgroups_reader.shapes()
+
+
+@pytest.fixture(name="blockgroups_records", scope="session")
+def fixture_blockgroups_records(blockgroups_reader):
+    """
+    All the records of the shapefiles/blockgroups test data,
+    read once per test session.
+    """
+    return blockgroups_reader.records()
+
+
+@pytest.fixture(name="blockgroups_shaperecords", scope="session")
+def fixture_blockgroups_shaperecords(blockgroups_reader):
+    """
+    All the shape records of the shapefiles/blockgroups test data,
+    as the ShapeRecords returned by shapeRecords(), read once per
+    test session.
+    """
+    return blockgroups_reader.shapeRecords()
+
+
+@pytest.fixture(name="blockgroups_field_names", scope="session")
+def fixture_blockgroups_field_names(blockgroups_reader):
+    """
+    The field names of the shapefiles/blockgroups test data, sans
+    the DeletionFlag, computed once per test session.
+    """
+    return [field[0] for field in blockgroups_reader.fields[1:]]
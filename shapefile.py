@@ -99,6 +99,13 @@ else:
 MISSING = [None, ""]
 NODATA = -10e38  # as per the ESRI shapefile spec, only used for m-values.
 
+# Precompiled structs for the fixed size values of shp file records.
+_REC_HEADER = Struct(">2i")
+_INT = Struct("<i")
+_BBOX = Struct("<4d")
+_DOUBLE_PAIR = Struct("<2d")
+_DOUBLE = Struct("<d")
+
 if PYTHON3:
 
     def b(v, encoding="utf-8", encodingErrors="strict"):
@@ -108,6 +115,9 @@ if PYTHON3:
         elif isinstance(v, bytes):
             # Already bytes.
             return v
+        elif isinstance(v, bytearray):
+            # Already encoded, copy the raw bytes as is.
+            return bytes(v)
         elif v is None:
             # Since we're dealing with text, interpret None as ""
             return b""
@@ -141,6 +151,9 @@ else:
         elif isinstance(v, bytes):
             # Already bytes.
             return v
+        elif isinstance(v, bytearray):
+            # Already encoded, copy the raw bytes as is.
+            return bytes(v)
         elif v is None:
             # Since we're dealing with text, interpret None as ""
             return ""
@@ -561,14 +574,9 @@ class Shape(object):
             else:
                 # get all polygon rings
                 rings = []
-                for i in xrange(len(self.parts)):
-                    # get indexes of start and end points of the ring
-                    start = self.parts[i]
-                    try:
-                        end = self.parts[i + 1]
-                    except IndexError:
-                        end = len(self.points)
-
+                # get indexes of start and end points of each ring
+                ends = list(self.parts[1:]) + [len(self.points)]
+                for start, end in zip(self.parts, ends):
                     # extract the points that make up the ring
                     ring = [tuple(p) for p in self.points[start:end]]
                     rings.append(ring)
@@ -1195,7 +1203,7 @@ class Reader(object):
                     shpLength = shp.tell()
                     shp.seek(100)
                     # Do a fast shape iteration until end of file.
-                    unpack = Struct(">2i").unpack
+                    unpack = _REC_HEADER.unpack
                     offsets = []
                     pos = shp.tell()
                     while pos < shpLength:
@@ -1369,29 +1377,30 @@ class Reader(object):
         f = self.__getFileObj(self.shp)
         record = Shape(oid=oid)
         nParts = nPoints = zmin = zmax = mmin = mmax = None
-        (recNum, recLength) = unpack(">2i", f.read(8))
+        (recNum, recLength) = _REC_HEADER.unpack(f.read(8))
         # Determine the start of the next record
         next = f.tell() + (2 * recLength)
-        shapeType = unpack("<i", f.read(4))[0]
+        shapeType = _INT.unpack(f.read(4))[0]
         record.shapeType = shapeType
         # For Null shapes create an empty points list for consistency
         if shapeType == 0:
             record.points = []
         # All shape types capable of having a bounding box
         elif shapeType in (3, 5, 8, 13, 15, 18, 23, 25, 28, 31):
-            record.bbox = _Array("d", unpack("<4d", f.read(32)))
+            shape_bbox = _BBOX.unpack(f.read(32))
             # if bbox specified and no overlap, skip this shape
-            if bbox is not None and not bbox_overlap(bbox, record.bbox):
+            if bbox is not None and not bbox_overlap(bbox, shape_bbox):
                 # because we stop parsing this shape, skip to beginning of
                 # next shape before we return
                 f.seek(next)
                 return None
+            record.bbox = _Array("d", shape_bbox)
         # Shape types with parts
         if shapeType in (3, 5, 13, 15, 23, 25, 31):
-            nParts = unpack("<i", f.read(4))[0]
+            nParts = _INT.unpack(f.read(4))[0]
         # Shape types with points
         if shapeType in (3, 5, 8, 13, 15, 18, 23, 25, 28, 31):
-            nPoints = unpack("<i", f.read(4))[0]
+            nPoints = _INT.unpack(f.read(4))[0]
         # Read parts
         if nParts:
             record.parts = _Array("i", unpack("<%si" % nParts, f.read(nParts * 4)))
@@ -1404,25 +1413,23 @@ class Reader(object):
             record.points = list(izip(*(iter(flat),) * 2))
         # Read z extremes and values
         if shapeType in (13, 15, 18, 31):
-            (zmin, zmax) = unpack("<2d", f.read(16))
+            (zmin, zmax) = _DOUBLE_PAIR.unpack(f.read(16))
             record.z = _Array("d", unpack("<%sd" % nPoints, f.read(nPoints * 8)))
         # Read m extremes and values
         if shapeType in (13, 15, 18, 23, 25, 28, 31):
             if next - f.tell() >= 16:
-                (mmin, mmax) = unpack("<2d", f.read(16))
+                (mmin, mmax) = _DOUBLE_PAIR.unpack(f.read(16))
             # Measure values less than -10e38 are nodata values according to the spec
             if next - f.tell() >= nPoints * 8:
-                record.m = []
-                for m in _Array("d", unpack("<%sd" % nPoints, f.read(nPoints * 8))):
-                    if m > NODATA:
-                        record.m.append(m)
-                    else:
-                        record.m.append(None)
+                record.m = [
+                    m if m > NODATA else None
+                    for m in unpack("<%sd" % nPoints, f.read(nPoints * 8))
+                ]
             else:
-                record.m = [None for _ in range(nPoints)]
+                record.m = [None] * nPoints
         # Read a single point
         if shapeType in (1, 11, 21):
-            record.points = [_Array("d", unpack("<2d", f.read(16)))]
+            record.points = [_Array("d", _DOUBLE_PAIR.unpack(f.read(16)))]
             if bbox is not None:
                 # create bounding box for Point by duplicating coordinates
                 point_bbox = list(record.points[0] + record.points[0])
@@ -1432,11 +1439,11 @@ class Reader(object):
                     return None
         # Read a single Z value
         if shapeType == 11:
-            record.z = list(unpack("<d", f.read(8)))
+            record.z = list(_DOUBLE.unpack(f.read(8)))
         # Read a single M value
         if shapeType in (21, 11):
             if next - f.tell() >= 8:
-                (m,) = unpack("<d", f.read(8))
+                (m,) = _DOUBLE.unpack(f.read(8))
             else:
                 m = NODATA
             # Measure values less than -10e38 are nodata values according to the spec
@@ -1505,7 +1512,7 @@ class Reader(object):
             shpLength = shp.tell()
             shp.seek(100)
             # Do a fast shape iteration until the requested index or end of file.
-            unpack = Struct(">2i").unpack
+            unpack = _REC_HEADER.unpack
             _i = 0
             offset = shp.tell()
             while offset < shpLength:
@@ -1595,6 +1602,8 @@ class Reader(object):
         )
         # read fields
         numFields = (self.__dbfHdrLength - 33) // 32
+        # deletion field goes at start, ahead of the fields read from the header
+        self.fields.append(("DeletionFlag", "C", 1, 0))
         for field in range(numFields):
             fieldDesc = list(unpack("<11sc4xBB14x", dbf.read(32)))
             name = 0
@@ -1614,9 +1623,6 @@ class Reader(object):
                 "Shapefile dbf header lacks expected terminator. (likely corrupt?)"
             )
 
-        # insert deletion field at start
-        self.fields.insert(0, ("DeletionFlag", "C", 1, 0))
-
         # store all field positions for easy lookups
         # note: fieldLookup gives the index position of a field inside Reader.fields
         self.__fieldLookup = dict((f[0], i) for i, f in enumerate(self.fields))
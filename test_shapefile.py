@@ -3,8 +3,11 @@ This module tests the functionality of shapefile.py.
 """
 
 import datetime
+import io
 import json
 import os.path
+from collections import deque
+from operator import attrgetter, itemgetter
 
 try:
     from pathlib import Path
@@ -18,418 +21,458 @@ import pytest
 # our imports
 import shapefile
 
-# define various test shape tuples of (type, points, parts indexes, and expected geo interface output)
-geo_interface_tests = [
-    (
-        shapefile.POINT,  # point
-        [(1, 1)],
-        [],
-        {"type": "Point", "coordinates": (1, 1)},
-    ),
-    (
-        shapefile.MULTIPOINT,  # multipoint
-        [(1, 1), (2, 1), (2, 2)],
-        [],
-        {"type": "MultiPoint", "coordinates": [(1, 1), (2, 1), (2, 2)]},
-    ),
-    (
-        shapefile.POLYLINE,  # single linestring
-        [(1, 1), (2, 1)],
-        [0],
-        {"type": "LineString", "coordinates": [(1, 1), (2, 1)]},
+# define various test shape cases of (type, points, parts indexes, and expected geo interface output),
+# each with a short id
+geo_interface_tests = (
+    pytest.param(
+        (
+            shapefile.POINT,  # point
+            [(1, 1)],
+            [],
+            {"type": "Point", "coordinates": (1, 1)},
+        ),
+        id="point",
     ),
-    (
-        shapefile.POLYLINE,  # multi linestring
-        [
-            (1, 1),
-            (2, 1),  # line 1
-            (10, 10),
-            (20, 10),
-        ],  # line 2
-        [0, 2],
-        {
-            "type": "MultiLineString",
-            "coordinates": [
-                [(1, 1), (2, 1)],  # line 1
-                [(10, 10), (20, 10)],  # line 2
-            ],
-        },
+    pytest.param(
+        (
+            shapefile.MULTIPOINT,  # multipoint
+            [(1, 1), (2, 1), (2, 2)],
+            [],
+            {"type": "MultiPoint", "coordinates": [(1, 1), (2, 1), (2, 2)]},
+        ),
+        id="multipoint",
     ),
-    (
-        shapefile.POLYGON,  # single polygon, no holes
-        [
-            (1, 1),
-            (1, 9),
-            (9, 9),
-            (9, 1),
-            (1, 1),  # exterior
-        ],
-        [0],
-        {
-            "type": "Polygon",
-            "coordinates": [
-                [(1, 1), (1, 9), (9, 9), (9, 1), (1, 1)],
-            ],
-        },
+    pytest.param(
+        (
+            shapefile.POLYLINE,  # single linestring
+            [(1, 1), (2, 1)],
+            [0],
+            {"type": "LineString", "coordinates": [(1, 1), (2, 1)]},
+        ),
+        id="linestring",
     ),
-    (
-        shapefile.POLYGON,  # single polygon, holes (ordered)
-        [
-            (1, 1),
-            (1, 9),
-            (9, 9),
-            (9, 1),
-            (1, 1),  # exterior
-            (2, 2),
-            (4, 2),
-            (4, 4),
-            (2, 4),
-            (2, 2),  # hole 1
-            (5, 5),
-            (7, 5),
-            (7, 7),
-            (5, 7),
-            (5, 5),  # hole 2
-        ],
-        [0, 5, 5 + 5],
-        {
-            "type": "Polygon",
-            "coordinates": [
-                [(1, 1), (1, 9), (9, 9), (9, 1), (1, 1)],  # exterior
-                [(2, 2), (4, 2), (4, 4), (2, 4), (2, 2)],  # hole 1
-                [(5, 5), (7, 5), (7, 7), (5, 7), (5, 5)],  # hole 2
-            ],
-        },
+    pytest.param(
+        (
+            shapefile.POLYLINE,  # multi linestring
+            [
+                (1, 1),
+                (2, 1),  # line 1
+                (10, 10),
+                (20, 10),
+            ],  # line 2
+            [0, 2],
+            {
+                "type": "MultiLineString",
+                "coordinates": [
+                    [(1, 1), (2, 1)],  # line 1
+                    [(10, 10), (20, 10)],  # line 2
+                ],
+            },
+        ),
+        id="multilinestring",
     ),
-    (
-        shapefile.POLYGON,  # single polygon, holes (unordered)
-        [
-            (2, 2),
-            (4, 2),
-            (4, 4),
-            (2, 4),
-            (2, 2),  # hole 1
-            (1, 1),
-            (1, 9),
-            (9, 9),
-            (9, 1),
-            (1, 1),  # exterior
-            (5, 5),
-            (7, 5),
-            (7, 7),
-            (5, 7),
-            (5, 5),  # hole 2
-        ],
-        [0, 5, 5 + 5],
-        {
-            "type": "Polygon",
-            "coordinates": [
-                [(1, 1), (1, 9), (9, 9), (9, 1), (1, 1)],  # exterior
-                [(2, 2), (4, 2), (4, 4), (2, 4), (2, 2)],  # hole 1
-                [(5, 5), (7, 5), (7, 7), (5, 7), (5, 5)],  # hole 2
+    pytest.param(
+        (
+            shapefile.POLYGON,  # single polygon, no holes
+            [
+                (1, 1),
+                (1, 9),
+                (9, 9),
+                (9, 1),
+                (1, 1),  # exterior
             ],
-        },
-    ),
-    (
-        shapefile.POLYGON,  # multi polygon, no holes
-        [
-            (1, 1),
-            (1, 9),
-            (9, 9),
-            (9, 1),
-            (1, 1),  # exterior
-            (11, 11),
-            (11, 19),
-            (19, 19),
-            (19, 11),
-            (11, 11),  # exterior
-        ],
-        [0, 5],
-        {
-            "type": "MultiPolygon",
-            "coordinates": [
-                [  # poly 1
+            [0],
+            {
+                "type": "Polygon",
+                "coordinates": [
                     [(1, 1), (1, 9), (9, 9), (9, 1), (1, 1)],
                 ],
-                [  # poly 2
-                    [(11, 11), (11, 19), (19, 19), (19, 11), (11, 11)],
-                ],
-            ],
-        },
+            },
+        ),
+        id="polygon_noholes",
     ),
-    (
-        shapefile.POLYGON,  # multi polygon, holes (unordered)
-        [
-            (1, 1),
-            (1, 9),
-            (9, 9),
-            (9, 1),
-            (1, 1),  # exterior 1
-            (11, 11),
-            (11, 19),
-            (19, 19),
-            (19, 11),
-            (11, 11),  # exterior 2
-            (12, 12),
-            (14, 12),
-            (14, 14),
-            (12, 14),
-            (12, 12),  # hole 2.1
-            (15, 15),
-            (17, 15),
-            (17, 17),
-            (15, 17),
-            (15, 15),  # hole 2.2
-            (2, 2),
-            (4, 2),
-            (4, 4),
-            (2, 4),
-            (2, 2),  # hole 1.1
-            (5, 5),
-            (7, 5),
-            (7, 7),
-            (5, 7),
-            (5, 5),  # hole 1.2
-        ],
-        [0, 5, 10, 15, 20, 25],
-        {
-            "type": "MultiPolygon",
-            "coordinates": [
-                [  # poly 1
+    pytest.param(
+        (
+            shapefile.POLYGON,  # single polygon, holes (ordered)
+            [
+                (1, 1),
+                (1, 9),
+                (9, 9),
+                (9, 1),
+                (1, 1),  # exterior
+                (2, 2),
+                (4, 2),
+                (4, 4),
+                (2, 4),
+                (2, 2),  # hole 1
+                (5, 5),
+                (7, 5),
+                (7, 7),
+                (5, 7),
+                (5, 5),  # hole 2
+            ],
+            [0, 5, 5 + 5],
+            {
+                "type": "Polygon",
+                "coordinates": [
                     [(1, 1), (1, 9), (9, 9), (9, 1), (1, 1)],  # exterior
                     [(2, 2), (4, 2), (4, 4), (2, 4), (2, 2)],  # hole 1
                     [(5, 5), (7, 5), (7, 7), (5, 7), (5, 5)],  # hole 2
                 ],
-                [  # poly 2
-                    [(11, 11), (11, 19), (19, 19), (19, 11), (11, 11)],  # exterior
-                    [(12, 12), (14, 12), (14, 14), (12, 14), (12, 12)],  # hole 1
-                    [(15, 15), (17, 15), (17, 17), (15, 17), (15, 15)],  # hole 2
-                ],
-            ],
-        },
-    ),
-    (
-        shapefile.POLYGON,  # multi polygon, nested exteriors with holes (unordered)
-        [
-            (1, 1),
-            (1, 9),
-            (9, 9),
-            (9, 1),
-            (1, 1),  # exterior 1
-            (3, 3),
-            (3, 7),
-            (7, 7),
-            (7, 3),
-            (3, 3),  # exterior 2
-            (4.5, 4.5),
-            (4.5, 5.5),
-            (5.5, 5.5),
-            (5.5, 4.5),
-            (4.5, 4.5),  # exterior 3
-            (4, 4),
-            (6, 4),
-            (6, 6),
-            (4, 6),
-            (4, 4),  # hole 2.1
-            (2, 2),
-            (8, 2),
-            (8, 8),
-            (2, 8),
-            (2, 2),  # hole 1.1
-        ],
-        [0, 5, 10, 15, 20],
-        {
-            "type": "MultiPolygon",
-            "coordinates": [
-                [  # poly 1
-                    [(1, 1), (1, 9), (9, 9), (9, 1), (1, 1)],  # exterior 1
-                    [(2, 2), (8, 2), (8, 8), (2, 8), (2, 2)],  # hole 1.1
-                ],
-                [  # poly 2
-                    [(3, 3), (3, 7), (7, 7), (7, 3), (3, 3)],  # exterior 2
-                    [(4, 4), (6, 4), (6, 6), (4, 6), (4, 4)],  # hole 2.1
-                ],
-                [  # poly 3
-                    [
-                        (4.5, 4.5),
-                        (4.5, 5.5),
-                        (5.5, 5.5),
-                        (5.5, 4.5),
-                        (4.5, 4.5),
-                    ],  # exterior 3
-                ],
-            ],
-        },
+            },
+        ),
+        id="polygon_holes_ordered",
     ),
-    (
-        shapefile.POLYGON,  # multi polygon, nested exteriors with holes (unordered and tricky holes designed to throw off ring_sample() test)
-        [
-            (1, 1),
-            (1, 9),
-            (9, 9),
-            (9, 1),
-            (1, 1),  # exterior 1
-            (3, 3),
-            (3, 7),
-            (7, 7),
-            (7, 3),
-            (3, 3),  # exterior 2
-            (4.5, 4.5),
-            (4.5, 5.5),
-            (5.5, 5.5),
-            (5.5, 4.5),
-            (4.5, 4.5),  # exterior 3
-            (4, 4),
-            (4, 4),
-            (6, 4),
-            (6, 4),
-            (6, 4),
-            (6, 6),
-            (4, 6),
-            (4, 4),  # hole 2.1 (hole has duplicate coords)
-            (2, 2),
-            (3, 3),
-            (4, 2),
-            (8, 2),
-            (8, 8),
-            (4, 8),
-            (2, 8),
-            (2, 4),
-            (
-                2,
-                2,
-            ),  # hole 1.1 (hole coords form straight line and starts in concave orientation)
-        ],
-        [0, 5, 10, 15, 20 + 3],
-        {
-            "type": "MultiPolygon",
-            "coordinates": [
-                [  # poly 1
-                    [(1, 1), (1, 9), (9, 9), (9, 1), (1, 1)],  # exterior 1
-                    [
-                        (2, 2),
-                        (3, 3),
-                        (4, 2),
-                        (8, 2),
-                        (8, 8),
-                        (4, 8),
-                        (2, 8),
-                        (2, 4),
-                        (2, 2),
-                    ],  # hole 1.1
-                ],
-                [  # poly 2
-                    [(3, 3), (3, 7), (7, 7), (7, 3), (3, 3)],  # exterior 2
-                    [
-                        (4, 4),
-                        (4, 4),
-                        (6, 4),
-                        (6, 4),
-                        (6, 4),
-                        (6, 6),
-                        (4, 6),
-                        (4, 4),
-                    ],  # hole 2.1
-                ],
-                [  # poly 3
-                    [
-                        (4.5, 4.5),
-                        (4.5, 5.5),
-                        (5.5, 5.5),
-                        (5.5, 4.5),
-                        (4.5, 4.5),
-                    ],  # exterior 3
-                ],
+    pytest.param(
+        (
+            shapefile.POLYGON,  # single polygon, holes (unordered)
+            [
+                (2, 2),
+                (4, 2),
+                (4, 4),
+                (2, 4),
+                (2, 2),  # hole 1
+                (1, 1),
+                (1, 9),
+                (9, 9),
+                (9, 1),
+                (1, 1),  # exterior
+                (5, 5),
+                (7, 5),
+                (7, 7),
+                (5, 7),
+                (5, 5),  # hole 2
             ],
-        },
-    ),
-    (
-        shapefile.POLYGON,  # multi polygon, holes incl orphaned holes (unordered), should raise warning
-        [
-            (1, 1),
-            (1, 9),
-            (9, 9),
-            (9, 1),
-            (1, 1),  # exterior 1
-            (11, 11),
-            (11, 19),
-            (19, 19),
-            (19, 11),
-            (11, 11),  # exterior 2
-            (12, 12),
-            (14, 12),
-            (14, 14),
-            (12, 14),
-            (12, 12),  # hole 2.1
-            (15, 15),
-            (17, 15),
-            (17, 17),
-            (15, 17),
-            (15, 15),  # hole 2.2
-            (95, 95),
-            (97, 95),
-            (97, 97),
-            (95, 97),
-            (95, 95),  # hole x.1 (orphaned hole, should be interpreted as exterior)
-            (2, 2),
-            (4, 2),
-            (4, 4),
-            (2, 4),
-            (2, 2),  # hole 1.1
-            (5, 5),
-            (7, 5),
-            (7, 7),
-            (5, 7),
-            (5, 5),  # hole 1.2
-        ],
-        [0, 5, 10, 15, 20, 25, 30],
-        {
-            "type": "MultiPolygon",
-            "coordinates": [
-                [  # poly 1
+            [0, 5, 5 + 5],
+            {
+                "type": "Polygon",
+                "coordinates": [
                     [(1, 1), (1, 9), (9, 9), (9, 1), (1, 1)],  # exterior
                     [(2, 2), (4, 2), (4, 4), (2, 4), (2, 2)],  # hole 1
                     [(5, 5), (7, 5), (7, 7), (5, 7), (5, 5)],  # hole 2
                 ],
-                [  # poly 2
-                    [(11, 11), (11, 19), (19, 19), (19, 11), (11, 11)],  # exterior
-                    [(12, 12), (14, 12), (14, 14), (12, 14), (12, 12)],  # hole 1
-                    [(15, 15), (17, 15), (17, 17), (15, 17), (15, 15)],  # hole 2
+            },
+        ),
+        id="polygon_holes_unordered",
+    ),
+    pytest.param(
+        (
+            shapefile.POLYGON,  # multi polygon, no holes
+            [
+                (1, 1),
+                (1, 9),
+                (9, 9),
+                (9, 1),
+                (1, 1),  # exterior
+                (11, 11),
+                (11, 19),
+                (19, 19),
+                (19, 11),
+                (11, 11),  # exterior
+            ],
+            [0, 5],
+            {
+                "type": "MultiPolygon",
+                "coordinates": [
+                    [  # poly 1
+                        [(1, 1), (1, 9), (9, 9), (9, 1), (1, 1)],
+                    ],
+                    [  # poly 2
+                        [(11, 11), (11, 19), (19, 19), (19, 11), (11, 11)],
+                    ],
                 ],
-                [  # poly 3 (orphaned hole)
-                    [(95, 95), (97, 95), (97, 97), (95, 97), (95, 95)],  # exterior
+            },
+        ),
+        id="multipolygon_noholes",
+    ),
+    pytest.param(
+        (
+            shapefile.POLYGON,  # multi polygon, holes (unordered)
+            [
+                (1, 1),
+                (1, 9),
+                (9, 9),
+                (9, 1),
+                (1, 1),  # exterior 1
+                (11, 11),
+                (11, 19),
+                (19, 19),
+                (19, 11),
+                (11, 11),  # exterior 2
+                (12, 12),
+                (14, 12),
+                (14, 14),
+                (12, 14),
+                (12, 12),  # hole 2.1
+                (15, 15),
+                (17, 15),
+                (17, 17),
+                (15, 17),
+                (15, 15),  # hole 2.2
+                (2, 2),
+                (4, 2),
+                (4, 4),
+                (2, 4),
+                (2, 2),  # hole 1.1
+                (5, 5),
+                (7, 5),
+                (7, 7),
+                (5, 7),
+                (5, 5),  # hole 1.2
+            ],
+            [0, 5, 10, 15, 20, 25],
+            {
+                "type": "MultiPolygon",
+                "coordinates": [
+                    [  # poly 1
+                        [(1, 1), (1, 9), (9, 9), (9, 1), (1, 1)],  # exterior
+                        [(2, 2), (4, 2), (4, 4), (2, 4), (2, 2)],  # hole 1
+                        [(5, 5), (7, 5), (7, 7), (5, 7), (5, 5)],  # hole 2
+                    ],
+                    [  # poly 2
+                        [(11, 11), (11, 19), (19, 19), (19, 11), (11, 11)],  # exterior
+                        [(12, 12), (14, 12), (14, 14), (12, 14), (12, 12)],  # hole 1
+                        [(15, 15), (17, 15), (17, 17), (15, 17), (15, 15)],  # hole 2
+                    ],
                 ],
+            },
+        ),
+        id="multipolygon_holes",
+    ),
+    pytest.param(
+        (
+            shapefile.POLYGON,  # multi polygon, nested exteriors with holes (unordered)
+            [
+                (1, 1),
+                (1, 9),
+                (9, 9),
+                (9, 1),
+                (1, 1),  # exterior 1
+                (3, 3),
+                (3, 7),
+                (7, 7),
+                (7, 3),
+                (3, 3),  # exterior 2
+                (4.5, 4.5),
+                (4.5, 5.5),
+                (5.5, 5.5),
+                (5.5, 4.5),
+                (4.5, 4.5),  # exterior 3
+                (4, 4),
+                (6, 4),
+                (6, 6),
+                (4, 6),
+                (4, 4),  # hole 2.1
+                (2, 2),
+                (8, 2),
+                (8, 8),
+                (2, 8),
+                (2, 2),  # hole 1.1
             ],
-        },
+            [0, 5, 10, 15, 20],
+            {
+                "type": "MultiPolygon",
+                "coordinates": [
+                    [  # poly 1
+                        [(1, 1), (1, 9), (9, 9), (9, 1), (1, 1)],  # exterior 1
+                        [(2, 2), (8, 2), (8, 8), (2, 8), (2, 2)],  # hole 1.1
+                    ],
+                    [  # poly 2
+                        [(3, 3), (3, 7), (7, 7), (7, 3), (3, 3)],  # exterior 2
+                        [(4, 4), (6, 4), (6, 6), (4, 6), (4, 4)],  # hole 2.1
+                    ],
+                    [  # poly 3
+                        [
+                            (4.5, 4.5),
+                            (4.5, 5.5),
+                            (5.5, 5.5),
+                            (5.5, 4.5),
+                            (4.5, 4.5),
+                        ],  # exterior 3
+                    ],
+                ],
+            },
+        ),
+        id="multipolygon_nested_exteriors",
     ),
-    (
-        shapefile.POLYGON,  # multi polygon, exteriors with wrong orientation (be nice and interpret as such), should raise warning
-        [
-            (1, 1),
-            (9, 1),
-            (9, 9),
-            (1, 9),
-            (1, 1),  # exterior with hole-orientation
-            (11, 11),
-            (19, 11),
-            (19, 19),
-            (11, 19),
-            (11, 11),  # exterior with hole-orientation
-        ],
-        [0, 5],
-        {
-            "type": "MultiPolygon",
-            "coordinates": [
-                [  # poly 1
-                    [(1, 1), (9, 1), (9, 9), (1, 9), (1, 1)],
+    pytest.param(
+        (
+            shapefile.POLYGON,  # multi polygon, nested exteriors with holes (unordered and tricky holes designed to throw off ring_sample() test)
+            [
+                (1, 1),
+                (1, 9),
+                (9, 9),
+                (9, 1),
+                (1, 1),  # exterior 1
+                (3, 3),
+                (3, 7),
+                (7, 7),
+                (7, 3),
+                (3, 3),  # exterior 2
+                (4.5, 4.5),
+                (4.5, 5.5),
+                (5.5, 5.5),
+                (5.5, 4.5),
+                (4.5, 4.5),  # exterior 3
+                (4, 4),
+                (4, 4),
+                (6, 4),
+                (6, 4),
+                (6, 4),
+                (6, 6),
+                (4, 6),
+                (4, 4),  # hole 2.1 (hole has duplicate coords)
+                (2, 2),
+                (3, 3),
+                (4, 2),
+                (8, 2),
+                (8, 8),
+                (4, 8),
+                (2, 8),
+                (2, 4),
+                (
+                    2,
+                    2,
+                ),  # hole 1.1 (hole coords form straight line and starts in concave orientation)
+            ],
+            [0, 5, 10, 15, 20 + 3],
+            {
+                "type": "MultiPolygon",
+                "coordinates": [
+                    [  # poly 1
+                        [(1, 1), (1, 9), (9, 9), (9, 1), (1, 1)],  # exterior 1
+                        [
+                            (2, 2),
+                            (3, 3),
+                            (4, 2),
+                            (8, 2),
+                            (8, 8),
+                            (4, 8),
+                            (2, 8),
+                            (2, 4),
+                            (2, 2),
+                        ],  # hole 1.1
+                    ],
+                    [  # poly 2
+                        [(3, 3), (3, 7), (7, 7), (7, 3), (3, 3)],  # exterior 2
+                        [
+                            (4, 4),
+                            (4, 4),
+                            (6, 4),
+                            (6, 4),
+                            (6, 4),
+                            (6, 6),
+                            (4, 6),
+                            (4, 4),
+                        ],  # hole 2.1
+                    ],
+                    [  # poly 3
+                        [
+                            (4.5, 4.5),
+                            (4.5, 5.5),
+                            (5.5, 5.5),
+                            (5.5, 4.5),
+                            (4.5, 4.5),
+                        ],  # exterior 3
+                    ],
                 ],
-                [  # poly 2
-                    [(11, 11), (19, 11), (19, 19), (11, 19), (11, 11)],
+            },
+        ),
+        id="multipolygon_nested_tricky_holes",
+    ),
+    pytest.param(
+        (
+            shapefile.POLYGON,  # multi polygon, holes incl orphaned holes (unordered), should raise warning
+            [
+                (1, 1),
+                (1, 9),
+                (9, 9),
+                (9, 1),
+                (1, 1),  # exterior 1
+                (11, 11),
+                (11, 19),
+                (19, 19),
+                (19, 11),
+                (11, 11),  # exterior 2
+                (12, 12),
+                (14, 12),
+                (14, 14),
+                (12, 14),
+                (12, 12),  # hole 2.1
+                (15, 15),
+                (17, 15),
+                (17, 17),
+                (15, 17),
+                (15, 15),  # hole 2.2
+                (95, 95),
+                (97, 95),
+                (97, 97),
+                (95, 97),
+                (95, 95),  # hole x.1 (orphaned hole, should be interpreted as exterior)
+                (2, 2),
+                (4, 2),
+                (4, 4),
+                (2, 4),
+                (2, 2),  # hole 1.1
+                (5, 5),
+                (7, 5),
+                (7, 7),
+                (5, 7),
+                (5, 5),  # hole 1.2
+            ],
+            [0, 5, 10, 15, 20, 25, 30],
+            {
+                "type": "MultiPolygon",
+                "coordinates": [
+                    [  # poly 1
+                        [(1, 1), (1, 9), (9, 9), (9, 1), (1, 1)],  # exterior
+                        [(2, 2), (4, 2), (4, 4), (2, 4), (2, 2)],  # hole 1
+                        [(5, 5), (7, 5), (7, 7), (5, 7), (5, 5)],  # hole 2
+                    ],
+                    [  # poly 2
+                        [(11, 11), (11, 19), (19, 19), (19, 11), (11, 11)],  # exterior
+                        [(12, 12), (14, 12), (14, 14), (12, 14), (12, 12)],  # hole 1
+                        [(15, 15), (17, 15), (17, 17), (15, 17), (15, 15)],  # hole 2
+                    ],
+                    [  # poly 3 (orphaned hole)
+                        [(95, 95), (97, 95), (97, 97), (95, 97), (95, 95)],  # exterior
+                    ],
                 ],
+            },
+        ),
+        id="multipolygon_orphaned_holes",
+    ),
+    pytest.param(
+        (
+            shapefile.POLYGON,  # multi polygon, exteriors with wrong orientation (be nice and interpret as such), should raise warning
+            [
+                (1, 1),
+                (9, 1),
+                (9, 9),
+                (1, 9),
+                (1, 1),  # exterior with hole-orientation
+                (11, 11),
+                (19, 11),
+                (19, 19),
+                (11, 19),
+                (11, 11),  # exterior with hole-orientation
             ],
-        },
+            [0, 5],
+            {
+                "type": "MultiPolygon",
+                "coordinates": [
+                    [  # poly 1
+                        [(1, 1), (9, 1), (9, 9), (1, 9), (1, 1)],
+                    ],
+                    [  # poly 2
+                        [(11, 11), (19, 11), (19, 19), (11, 19), (11, 11)],
+                    ],
+                ],
+            },
+        ),
+        id="multipolygon_wrong_orientation",
     ),
-]
+)
 
 
 def test_empty_shape_geo_interface():
@@ -443,78 +486,104 @@ def test_empty_shape_geo_interface():
         getattr(shape, "__geo_interface__")
 
 
-@pytest.mark.parametrize("typ,points,parts,expected", geo_interface_tests)
-def test_expected_shape_geo_interface(typ, points, parts, expected):
+@pytest.fixture(
+    name="geo_interface_case",
+    scope="module",
+    params=geo_interface_tests,
+)
+def fixture_geo_interface_case(request):
+    """
+    Builds the Shape for each of the geo_interface_tests and calls its
+    __geo_interface__ once per module, returned together with the
+    expected geo interface output.
+    """
+    typ, points, parts, expected = request.param
+    shape = shapefile.Shape(typ, points, parts)
+    return shape.__geo_interface__, expected
+
+
+def test_expected_shape_geo_interface(geo_interface_case):
     """
     Assert that calling __geo_interface__
     on arbitrary input Shape works as expected.
     """
-    shape = shapefile.Shape(typ, points, parts)
-    geoj = shape.__geo_interface__
+    geoj, expected = geo_interface_case
     assert geoj == expected
 
 
-def test_reader_geo_interface():
-    with shapefile.Reader("shapefiles/blockgroups") as r:
-        geoj = r.__geo_interface__
-        assert geoj["type"] == "FeatureCollection"
-        assert "bbox" in geoj
-        assert json.dumps(geoj)
+def assert_json_serializable(geoj):
+    """
+    Assert that geoj can be encoded as json, discarding the encoded
+    chunks as they are produced instead of building the whole string.
+    """
+    deque(json.JSONEncoder().iterencode(geoj), maxlen=0)
+
+
+def in_memory_files():
+    """
+    New empty io.BytesIO objects for the shp, shx and dbf files, keyed by
+    their extension, to write a shapefile to and read it back in memory.
+    """
+    return dict((ext, io.BytesIO()) for ext in ("shp", "shx", "dbf"))
+
+
+def test_reader_geo_interface(blockgroups_reader):
+    r = blockgroups_reader
+    geoj = r.__geo_interface__
+    assert geoj["type"] == "FeatureCollection"
+    assert "bbox" in geoj
+    assert_json_serializable(geoj)
 
 
-def test_shapes_geo_interface():
-    with shapefile.Reader("shapefiles/blockgroups") as r:
-        geoj = r.shapes().__geo_interface__
-        assert geoj["type"] == "GeometryCollection"
-        assert json.dumps(geoj)
+def test_shapes_geo_interface(blockgroups_shapes):
+    geoj = blockgroups_shapes.__geo_interface__
+    assert geoj["type"] == "GeometryCollection"
+    assert_json_serializable(geoj)
 
 
-def test_shaperecords_geo_interface():
-    with shapefile.Reader("shapefiles/blockgroups") as r:
-        geoj = r.shapeRecords().__geo_interface__
-        assert geoj["type"] == "FeatureCollection"
-        assert json.dumps(geoj)
+def test_shaperecords_geo_interface(blockgroups_shaperecords):
+    geoj = blockgroups_shaperecords.__geo_interface__
+    assert geoj["type"] == "FeatureCollection"
+    assert_json_serializable(geoj)
 
 
-def test_shaperecord_geo_interface():
-    with shapefile.Reader("shapefiles/blockgroups") as r:
-        for shaperec in r:
-            assert json.dumps(shaperec.__geo_interface__)
+def test_shaperecord_geo_interface(blockgroups_shaperecords):
+    for shaperec in blockgroups_shaperecords:
+        assert_json_serializable(shaperec.__geo_interface__)
 
 
 @pytest.mark.network
-def test_reader_url():
+@pytest.mark.parametrize(
+    "url",
+    [
+        "https://github.com/nvkelso/natural-earth-vector/blob/master/110m_cultural/ne_110m_admin_0_tiny_countries.shp?raw=true",
+        "https://github.com/nvkelso/natural-earth-vector/blob/master/110m_cultural/ne_110m_admin_0_tiny_countries?raw=true",
+        "https://github.com/JamesParrott/PyShp_test_shapefile/raw/main/gis_osm_natural_a_free_1.zip",
+    ],
+    ids=["with_extension", "without_extension", "zipfile"],
+)
+def test_reader_url(url):
+    """
+    Assert that Reader can open shapefiles from a url,
+    with or without the extension, or from a zipfile.
     """
-    Assert that Reader can open shapefiles from a url.
-    """
-    # test with extension
-    url = "https://github.com/nvkelso/natural-earth-vector/blob/master/110m_cultural/ne_110m_admin_0_tiny_countries.shp?raw=true"
-    with shapefile.Reader(url) as sf:
-        for __recShape in sf.iterShapeRecords():
-            pass
-    assert sf.shp.closed is sf.shx.closed is sf.dbf.closed is True
-
-    # test without extension
-    url = "https://github.com/nvkelso/natural-earth-vector/blob/master/110m_cultural/ne_110m_admin_0_tiny_countries?raw=true"
     with shapefile.Reader(url) as sf:
         for __recShape in sf.iterShapeRecords():
             pass
         assert len(sf) > 0
     assert sf.shp.closed is sf.shx.closed is sf.dbf.closed is True
 
-    # test no files found
+
+@pytest.mark.network
+def test_reader_url_no_files_found():
+    """
+    Assert that Reader raises a ShapefileException when
+    there are no shapefiles at the url.
+    """
     url = "https://raw.githubusercontent.com/nvkelso/natural-earth-vector/master/README.md"
     with pytest.raises(shapefile.ShapefileException):
-        with shapefile.Reader(url) as sf:
-            pass
-
-    # test reading zipfile from url
-    url = "https://github.com/JamesParrott/PyShp_test_shapefile/raw/main/gis_osm_natural_a_free_1.zip"
-    with shapefile.Reader(url) as sf:
-        for __recShape in sf.iterShapeRecords():
+        with shapefile.Reader(url):
             pass
-        assert len(sf) > 0
-    assert sf.shp.closed is sf.shx.closed is sf.dbf.closed is True
 
 
 def test_reader_zip():
@@ -577,18 +646,15 @@ def test_reader_close_path():
     sf.close()
 
 
-def test_reader_close_filelike():
+def test_reader_close_filelike(blockgroups_buffers):
     """
     Assert that manually calling Reader.close()
     leaves the shp, shx, and dbf files open
     on exit, if given filelike objects.
     """
-    # note uses an actual shapefile from
-    # the projects "shapefiles" directory
-    shp = open("shapefiles/blockgroups.shp", mode="rb")
-    shx = open("shapefiles/blockgroups.shx", mode="rb")
-    dbf = open("shapefiles/blockgroups.dbf", mode="rb")
-    sf = shapefile.Reader(shp=shp, shx=shx, dbf=dbf)
+    # note uses in memory copies of an actual shapefile
+    # from the projects "shapefiles" directory
+    sf = shapefile.Reader(**blockgroups_buffers)
     sf.close()
 
     assert sf.shp.closed is False
@@ -596,7 +662,7 @@ def test_reader_close_filelike():
     assert sf.shx.closed is False
 
     # check that can read again
-    sf = shapefile.Reader(shp=shp, shx=shx, dbf=dbf)
+    sf = shapefile.Reader(**blockgroups_buffers)
     sf.close()
 
 
@@ -620,18 +686,15 @@ def test_reader_context_path():
         pass
 
 
-def test_reader_context_filelike():
+def test_reader_context_filelike(blockgroups_buffers):
     """
     Assert that using the context manager
     leaves the shp, shx, and dbf files open
     on exit, if given filelike objects.
     """
-    # note uses an actual shapefile from
-    # the projects "shapefiles" directory
-    shp = open("shapefiles/blockgroups.shp", mode="rb")
-    shx = open("shapefiles/blockgroups.shx", mode="rb")
-    dbf = open("shapefiles/blockgroups.dbf", mode="rb")
-    with shapefile.Reader(shp=shp, shx=shx, dbf=dbf) as sf:
+    # note uses in memory copies of an actual shapefile
+    # from the projects "shapefiles" directory
+    with shapefile.Reader(**blockgroups_buffers) as sf:
         pass
 
     assert sf.shp.closed is False
@@ -639,55 +702,54 @@ def test_reader_context_filelike():
     assert sf.shx.closed is False
 
     # check that can read again
-    with shapefile.Reader(shp=shp, shx=shx, dbf=dbf) as sf:
+    with shapefile.Reader(**blockgroups_buffers) as sf:
         pass
 
 
-def test_reader_shapefile_type():
+def test_reader_shapefile_type(blockgroups_reader):
     """
     Assert that the type of the shapefile
     is returned correctly.
     """
-    with shapefile.Reader("shapefiles/blockgroups") as sf:
-        assert sf.shapeType == 5  # 5 means Polygon
-        assert sf.shapeType == shapefile.POLYGON
-        assert sf.shapeTypeName == "POLYGON"
+    sf = blockgroups_reader
+    assert sf.shapeType == 5  # 5 means Polygon
+    assert sf.shapeType == shapefile.POLYGON
+    assert sf.shapeTypeName == "POLYGON"
 
 
-def test_reader_shapefile_length():
+def test_reader_shapefile_length(blockgroups_reader, blockgroups_shapes):
     """
     Assert that the length the reader gives us
     matches up with the number of records
     in the file.
     """
-    with shapefile.Reader("shapefiles/blockgroups") as sf:
-        assert len(sf) == len(sf.shapes())
+    assert len(blockgroups_reader) == len(blockgroups_shapes)
 
 
-def test_shape_metadata():
-    with shapefile.Reader("shapefiles/blockgroups") as sf:
-        shape = sf.shape(0)
-        assert shape.shapeType == 5  # Polygon
-        assert shape.shapeType == shapefile.POLYGON
-        assert sf.shapeTypeName == "POLYGON"
+def test_shape_metadata(blockgroups_reader):
+    sf = blockgroups_reader
+    shape = sf.shape(0)
+    assert shape.shapeType == 5  # Polygon
+    assert shape.shapeType == shapefile.POLYGON
+    assert sf.shapeTypeName == "POLYGON"
 
 
-def test_reader_fields():
+def test_reader_fields(blockgroups_reader):
     """
     Assert that the reader's fields attribute
     gives the shapefile's fields as a list.
     Assert that each field has a name,
     type, field length, and decimal length.
     """
-    with shapefile.Reader("shapefiles/blockgroups") as sf:
-        fields = sf.fields
-        assert isinstance(fields, list)
+    sf = blockgroups_reader
+    fields = sf.fields
+    assert isinstance(fields, list)
 
-        field = fields[0]
-        assert isinstance(field[0], str)  # field name
-        assert field[1] in ["C", "N", "F", "L", "D", "M"]  # field type
-        assert isinstance(field[2], int)  # field length
-        assert isinstance(field[3], int)  # decimal length
+    field = fields[0]
+    assert isinstance(field[0], str)  # field name
+    assert field[1] in ("C", "N", "F", "L", "D", "M")  # field type
+    assert isinstance(field[2], int)  # field length
+    assert isinstance(field[3], int)  # decimal length
 
 
 def test_reader_shapefile_extension_ignored():
@@ -714,114 +776,31 @@ def test_reader_pathlike():
         assert len(sf) == 663
 
 
-def test_reader_dbf_only():
-    """
-    Assert that specifying just the
-    dbf argument to the shapefile reader
-    reads just the dbf file.
-    """
-    with shapefile.Reader(dbf="shapefiles/blockgroups.dbf") as sf:
-        assert len(sf) == 663
-        record = sf.record(3)
-        assert record[1:3] == ["060750601001", 4715]
-
-
-def test_reader_shp_shx_only():
-    """
-    Assert that specifying just the
-    shp and shx argument to the shapefile reader
-    reads just the shp and shx file.
-    """
-    with shapefile.Reader(
-        shp="shapefiles/blockgroups.shp", shx="shapefiles/blockgroups.shx"
-    ) as sf:
-        assert len(sf) == 663
-        shape = sf.shape(3)
-        assert len(shape.points) == 173
-
-
-def test_reader_shp_dbf_only():
-    """
-    Assert that specifying just the
-    shp and shx argument to the shapefile reader
-    reads just the shp and dbf file.
-    """
-    with shapefile.Reader(
-        shp="shapefiles/blockgroups.shp", dbf="shapefiles/blockgroups.dbf"
-    ) as sf:
-        assert len(sf) == 663
-        shape = sf.shape(3)
-        assert len(shape.points) == 173
-        record = sf.record(3)
-        assert record[1:3] == ["060750601001", 4715]
-
-
-def test_reader_shp_only():
-    """
-    Assert that specifying just the
-    shp argument to the shapefile reader
-    reads just the shp file (shx optional).
-    """
-    with shapefile.Reader(shp="shapefiles/blockgroups.shp") as sf:
-        assert len(sf) == 663
-        shape = sf.shape(3)
-        assert len(shape.points) == 173
-
-
-def test_reader_filelike_dbf_only():
-    """
-    Assert that specifying just the
-    dbf argument to the shapefile reader
-    reads just the dbf file.
-    """
-    with shapefile.Reader(dbf=open("shapefiles/blockgroups.dbf", "rb")) as sf:
-        assert len(sf) == 663
-        record = sf.record(3)
-        assert record[1:3] == ["060750601001", 4715]
-
-
-def test_reader_filelike_shp_shx_only():
-    """
-    Assert that specifying just the
-    shp and shx argument to the shapefile reader
-    reads just the shp and shx file.
-    """
-    with shapefile.Reader(
-        shp=open("shapefiles/blockgroups.shp", "rb"),
-        shx=open("shapefiles/blockgroups.shx", "rb"),
-    ) as sf:
-        assert len(sf) == 663
-        shape = sf.shape(3)
-        assert len(shape.points) == 173
-
-
-def test_reader_filelike_shp_dbf_only():
-    """
-    Assert that specifying just the
-    shp and shx argument to the shapefile reader
-    reads just the shp and dbf file.
-    """
-    with shapefile.Reader(
-        shp=open("shapefiles/blockgroups.shp", "rb"),
-        dbf=open("shapefiles/blockgroups.dbf", "rb"),
-    ) as sf:
+@pytest.mark.parametrize("filelike", [False, True], ids=["path", "filelike"])
+@pytest.mark.parametrize(
+    "exts",
+    [("dbf",), ("shp", "shx"), ("shp", "dbf"), ("shp",)],
+    ids=["dbf_only", "shp_shx_only", "shp_dbf_only", "shp_only"],
+)
+def test_reader_only(exts, filelike, blockgroups_buffers):
+    """
+    Assert that specifying just some of the
+    shp, shx and dbf arguments to the shapefile reader,
+    as paths or filelike objects, reads just those files
+    (shx optional).
+    """
+    if filelike:
+        kwargs = dict((ext, blockgroups_buffers[ext]) for ext in exts)
+    else:
+        kwargs = dict((ext, "shapefiles/blockgroups." + ext) for ext in exts)
+    with shapefile.Reader(**kwargs) as sf:
         assert len(sf) == 663
-        shape = sf.shape(3)
-        assert len(shape.points) == 173
-        record = sf.record(3)
-        assert record[1:3] == ["060750601001", 4715]
-
-
-def test_reader_filelike_shp_only():
-    """
-    Assert that specifying just the
-    shp argument to the shapefile reader
-    reads just the shp file (shx optional).
-    """
-    with shapefile.Reader(shp=open("shapefiles/blockgroups.shp", "rb")) as sf:
-        assert len(sf) == 663
-        shape = sf.shape(3)
-        assert len(shape.points) == 173
+        if "shp" in exts:
+            shape = sf.shape(3)
+            assert len(shape.points) == 173
+        if "dbf" in exts:
+            record = sf.record(3)
+            assert record[1:3] == ["060750601001", 4715]
 
 
 def test_reader_shapefile_delayed_load():
@@ -838,18 +817,17 @@ def test_reader_shapefile_delayed_load():
         assert len(sf) == 663
 
 
-def test_records_match_shapes():
+def test_records_match_shapes(blockgroups_records, blockgroups_shapes):
     """
     Assert that the number of records matches
     the number of shapes in the shapefile.
     """
-    with shapefile.Reader("shapefiles/blockgroups") as sf:
-        records = sf.records()
-        shapes = sf.shapes()
-        assert len(records) == len(shapes)
+    assert len(blockgroups_records) == len(blockgroups_shapes)
 
 
-def test_record_attributes(fields=None):
+def test_record_attributes(
+    blockgroups_reader, blockgroups_records, blockgroups_field_names, fields=None
+):
     """
     Assert that record retrieves all relevant values and can
     be accessed as attributes and dictionary items.
@@ -857,292 +835,253 @@ def test_record_attributes(fields=None):
     # note
     # second element in fields matches first element
     # in record because records dont have DeletionFlag
-    with shapefile.Reader("shapefiles/blockgroups") as sf:
-        for i in range(len(sf)):
-            # full record
-            full_record = sf.record(i)
-            # user-fetched record
-            if fields is not None:
-                # only a subset of fields
-                record = sf.record(i, fields=fields)
-            else:
-                # default all fields
-                record = full_record
-                fields = [
-                    field[0] for field in sf.fields[1:]
-                ]  # fieldnames, sans del flag
-            # check correct length
-            assert len(record) == len(set(fields))
-            # check record values (should be in same order as shapefile fields)
-            i = 0
-            for field in sf.fields:
-                field_name = field[0]
-                if field_name in fields:
-                    assert (
-                        record[i] == record[field_name] == getattr(record, field_name)
-                    )
-                    i += 1
-
-
-def test_record_subfields():
-    """
-    Assert that reader correctly retrieves only a subset
-    of fields when specified.
-    """
-    fields = ["AREA", "POP1990", "MALES", "FEMALES", "MOBILEHOME"]
-    test_record_attributes(fields=fields)
-
-
-def test_record_subfields_unordered():
+    sf = blockgroups_reader
+    field_names = blockgroups_field_names  # fieldnames, sans del flag
+    # the fieldnames to check, and their index position in each record
+    # (should be in same order as shapefile fields)
+    wanted = set(field_names if fields is None else fields)
+    names = [name for name in field_names if name in wanted]
+    if names:
+        # fetch all the checked values of a record at once, by index, name and attribute
+        get_by_index = itemgetter(*range(len(names)))
+        get_by_name = itemgetter(*names)
+        get_by_attr = attrgetter(*names)
+    for i, full_record in enumerate(blockgroups_records):
+        # user-fetched record
+        if fields is not None:
+            # only a subset of fields
+            record = sf.record(i, fields=fields)
+        else:
+            # default all fields
+            record = full_record
+        # check correct length
+        assert len(record) == len(wanted)
+        # check record values
+        if names:
+            assert get_by_index(record) == get_by_name(record) == get_by_attr(record)
+
+
+@pytest.mark.parametrize(
+    "fields",
+    [
+        ["AREA", "POP1990", "MALES", "FEMALES", "MOBILEHOME"],
+        sorted(["AREA", "POP1990", "MALES", "FEMALES", "MOBILEHOME"]),
+        ["AREA", "AREA", "AREA", "MALES", "MALES", "MOBILEHOME"],
+        [],
+    ],
+    ids=["subset", "unordered", "duplicates", "empty"],
+)
+def test_record_subfields(
+    blockgroups_reader, blockgroups_records, blockgroups_field_names, fields
+):
     """
     Assert that reader correctly retrieves only a subset
     of fields when specified, given in random order but
-    retrieved in the order of the shapefile fields.
+    retrieved in the order of the shapefile fields,
+    handling duplicate input fields, and retrieving
+    no fields when given an empty list.
     """
-    fields = sorted(["AREA", "POP1990", "MALES", "FEMALES", "MOBILEHOME"])
-    test_record_attributes(fields=fields)
+    test_record_attributes(
+        blockgroups_reader, blockgroups_records, blockgroups_field_names, fields=fields
+    )
+    # check that only one value per unique field
+    rec = blockgroups_reader.record(0, fields=fields)
+    assert len(rec) == len(set(fields))
 
 
-def test_record_subfields_delflag_notvalid():
+def test_record_subfields_delflag_notvalid(
+    blockgroups_reader, blockgroups_records, blockgroups_field_names
+):
     """
     Assert that reader does not consider DeletionFlag as a valid field name.
     """
     fields = ["DeletionFlag", "AREA", "POP1990", "MALES", "FEMALES", "MOBILEHOME"]
     with pytest.raises(ValueError):
-        test_record_attributes(fields=fields)
-
-
-def test_record_subfields_duplicates():
-    """
-    Assert that reader correctly retrieves only a subset
-    of fields when specified, handling duplicate input fields.
-    """
-    fields = ["AREA", "AREA", "AREA", "MALES", "MALES", "MOBILEHOME"]
-    test_record_attributes(fields=fields)
-    # check that only 3 values
-    with shapefile.Reader("shapefiles/blockgroups") as sf:
-        rec = sf.record(0, fields=fields)
-        assert len(rec) == len(set(fields))
-
-
-def test_record_subfields_empty():
-    """
-    Assert that reader does not retrieve any fields when given
-    an empty list.
-    """
-    fields = []
-    test_record_attributes(fields=fields)
-    # check that only 0 values
-    with shapefile.Reader("shapefiles/blockgroups") as sf:
-        rec = sf.record(0, fields=fields)
-        assert len(rec) == 0
+        test_record_attributes(
+            blockgroups_reader,
+            blockgroups_records,
+            blockgroups_field_names,
+            fields=fields,
+        )
 
 
-def test_record_as_dict():
+def test_record_as_dict(blockgroups_reader):
     """
     Assert that a record object can be converted
     into a dictionary and data remains correct.
     """
-    with shapefile.Reader("shapefiles/blockgroups") as sf:
-        record = sf.record(0)
-        as_dict = record.as_dict()
+    sf = blockgroups_reader
+    record = sf.record(0)
+    as_dict = record.as_dict()
 
-        assert len(record) == len(as_dict)
-        for key, value in as_dict.items():
-            assert record[key] == value
+    assert len(record) == len(as_dict)
+    for key, value in as_dict.items():
+        assert record[key] == value
 
 
-def test_record_oid():
+def test_record_oid(blockgroups_reader, blockgroups_records, blockgroups_shaperecords):
     """
     Assert that the record's oid attribute returns
     its index in the shapefile.
     """
-    with shapefile.Reader("shapefiles/blockgroups") as sf:
-        for i in range(len(sf)):
-            record = sf.record(i)
-            assert record.oid == i
-
-        for i, record in enumerate(sf.records()):
-            assert record.oid == i
-
-        for i, record in enumerate(sf.iterRecords()):
-            assert record.oid == i
+    sf = blockgroups_reader
+    oids = list(range(len(sf)))
+    assert [sf.record(i).oid for i in oids] == oids
+    assert [record.oid for record in blockgroups_records] == oids
+    assert [record.oid for record in sf.iterRecords()] == oids
+    assert [shaperec.record.oid for shaperec in blockgroups_shaperecords] == oids
+    assert [shaperec.record.oid for shaperec in sf.iterShapeRecords()] == oids
 
-        for i, shaperec in enumerate(sf.iterShapeRecords()):
-            assert shaperec.record.oid == i
 
-
-def test_iterRecords_start_stop():
+def test_iterRecords_start_stop(blockgroups_reader, blockgroups_records):
     """
     Assert that Reader.iterRecords(start, stop)
     returns the correct records, as if searched for
-    by index with Reader.record
-    """
-
-    with shapefile.Reader("shapefiles/blockgroups") as sf:
-        N = len(sf)
-
-        # Arbitrary selection of record indices
-        # (there are 663 records in blockgroups.dbf).
-        for i in [
-            0,
-            1,
-            2,
-            3,
-            5,
-            11,
-            17,
-            33,
-            51,
-            103,
-            170,
-            234,
-            435,
-            543,
-            N - 3,
-            N - 2,
-            N - 1,
-        ]:
-            for record in sf.iterRecords(start=i):
-                assert record == sf.record(record.oid)
-
-            for record in sf.iterRecords(stop=i):
-                assert record == sf.record(record.oid)
-
-            for stop in range(i, len(sf)):
-                # test negative indexing from end, as well as
-                # positive values of stop, and its default
-                for stop_arg in (stop, stop - len(sf)):
-                    for record in sf.iterRecords(start=i, stop=stop_arg):
-                        assert record == sf.record(record.oid)
-
-
-def test_shape_oid():
+    by index in the list returned by Reader.records
+    """
+
+    sf = blockgroups_reader
+    N = len(sf)
+
+    # Arbitrary selection of record indices
+    # (there are 663 records in blockgroups.dbf).
+    for i in [
+        0,
+        1,
+        2,
+        3,
+        5,
+        11,
+        17,
+        33,
+        51,
+        103,
+        170,
+        234,
+        435,
+        543,
+        N - 3,
+        N - 2,
+        N - 1,
+    ]:
+        for record in sf.iterRecords(start=i):
+            assert record == blockgroups_records[record.oid]
+
+        for record in sf.iterRecords(stop=i):
+            assert record == blockgroups_records[record.oid]
+
+        # A few values of stop from i up to the last record, rather
+        # than all of them, to keep the number of records read linear.
+        for stop in sorted(set(s for s in (i, i + 1, i + 10, N - 1) if s < N)):
+            # test negative indexing from end, as well as
+            # positive values of stop, and its default
+            for stop_arg in (stop, stop - N):
+                records = list(sf.iterRecords(start=i, stop=stop_arg))
+                assert [record.oid for record in records] == list(range(i, stop))
+                for record in records:
+                    assert record == blockgroups_records[record.oid]
+
+
+def assert_shape_oids(sf, expected_geo=None):
+    """
+    Assert that the oid of each shape read with shape(), shapes(),
+    iterShapes() and iterShapeRecords() is its index in the shapefile,
+    and if given, that its geo interface is the one at the same index
+    in expected_geo.
+    """
+    oids = list(range(len(sf)))
+    for shapes in (
+        [sf.shape(i) for i in oids],
+        sf.shapes(),
+        list(sf.iterShapes()),
+        [shaperec.shape for shaperec in sf.iterShapeRecords()],
+    ):
+        assert [shape.oid for shape in shapes] == oids
+        if expected_geo is not None:
+            assert [shape.__geo_interface__ for shape in shapes] == expected_geo
+
+
+def test_shape_oid(blockgroups_reader):
     """
     Assert that the shape's oid attribute returns
     its index in the shapefile.
     """
-    with shapefile.Reader("shapefiles/blockgroups") as sf:
-        for i in range(len(sf)):
-            shape = sf.shape(i)
-            assert shape.oid == i
-
-        for i, shape in enumerate(sf.shapes()):
-            assert shape.oid == i
-
-        for i, shape in enumerate(sf.iterShapes()):
-            assert shape.oid == i
-
-        for i, shaperec in enumerate(sf.iterShapeRecords()):
-            assert shaperec.shape.oid == i
+    assert_shape_oids(blockgroups_reader)
 
 
-def test_shape_oid_no_shx():
+def test_shape_oid_no_shx(blockgroups_reader_no_shx, blockgroups_shapes):
     """
     Assert that the shape's oid attribute returns
     its index in the shapefile, when shx file is missing.
     """
-    basename = "shapefiles/blockgroups"
-    shp = open(basename + ".shp", "rb")
-    dbf = open(basename + ".dbf", "rb")
-    with shapefile.Reader(shp=shp, dbf=dbf) as sf:
-        with shapefile.Reader(basename) as sf_expected:
-            for i in range(len(sf)):
-                shape = sf.shape(i)
-                assert shape.oid == i
-                shape_expected = sf_expected.shape(i)
-                assert shape.__geo_interface__ == shape_expected.__geo_interface__
-
-            for i, shape in enumerate(sf.shapes()):
-                assert shape.oid == i
-                shape_expected = sf_expected.shape(i)
-                assert shape.__geo_interface__ == shape_expected.__geo_interface__
-
-            for i, shape in enumerate(sf.iterShapes()):
-                assert shape.oid == i
-                shape_expected = sf_expected.shape(i)
-                assert shape.__geo_interface__ == shape_expected.__geo_interface__
-
-            for i, shaperec in enumerate(sf.iterShapeRecords()):
-                assert shaperec.shape.oid == i
-                shape_expected = sf_expected.shape(i)
-                assert (
-                    shaperec.shape.__geo_interface__ == shape_expected.__geo_interface__
-                )
-
-
-def test_reader_offsets():
+    # the geo interface of each shape as read with the shx file
+    expected_geo = [shape.__geo_interface__ for shape in blockgroups_shapes]
+    assert_shape_oids(blockgroups_reader_no_shx, expected_geo)
+
+
+def test_reader_offsets(blockgroups_shapes):
     """
     Assert that reader will not read the shx offsets unless necessary,
     i.e. requesting a shape index.
     """
-    basename = "shapefiles/blockgroups"
-    with shapefile.Reader(basename) as sf:
+    with shapefile.Reader("shapefiles/blockgroups") as sf:
         # shx offsets should not be read during loading
         assert not sf._offsets
         # reading a shape index should trigger reading offsets from shx file
         sf.shape(3)
-        assert len(sf._offsets) == len(sf.shapes())
+        assert len(sf._offsets) == len(blockgroups_shapes)
 
 
-def test_reader_offsets_no_shx():
+def test_reader_offsets_no_shx(blockgroups_reader_no_shx):
     """
     Assert that reading a shapefile without a shx file will not build
     the offsets unless necessary, i.e. reading all the shapes.
     """
-    basename = "shapefiles/blockgroups"
-    shp = open(basename + ".shp", "rb")
-    dbf = open(basename + ".dbf", "rb")
-    with shapefile.Reader(shp=shp, dbf=dbf) as sf:
-        # offsets should not be built during loading
-        assert not sf._offsets
-        # reading a shape index should iterate to the shape
-        # but the list of offsets should remain empty
-        sf.shape(3)
-        assert not sf._offsets
-        # reading all the shapes should build the list of offsets
-        shapes = sf.shapes()
-        assert len(sf._offsets) == len(shapes)
+    sf = blockgroups_reader_no_shx
+    # offsets should not be built during loading
+    assert not sf._offsets
+    # reading a shape index should iterate to the shape
+    # but the list of offsets should remain empty
+    sf.shape(3)
+    assert not sf._offsets
+    # reading all the shapes should build the list of offsets
+    shapes = sf.shapes()
+    assert len(sf._offsets) == len(shapes)
 
 
-def test_reader_numshapes():
+def test_reader_numshapes(blockgroups_reader, blockgroups_shapes):
     """
     Assert that reader reads the numShapes attribute from the
     shx file header during loading.
     """
-    basename = "shapefiles/blockgroups"
-    with shapefile.Reader(basename) as sf:
-        # numShapes should be set during loading
-        assert sf.numShapes is not None
-        # numShapes should equal the number of shapes
-        assert sf.numShapes == len(sf.shapes())
+    sf = blockgroups_reader
+    # numShapes should be set during loading
+    assert sf.numShapes is not None
+    # numShapes should equal the number of shapes
+    assert sf.numShapes == len(blockgroups_shapes)
 
 
-def test_reader_numshapes_no_shx():
+def test_reader_numshapes_no_shx(blockgroups_reader_no_shx):
     """
     Assert that reading a shapefile without a shx file will have
     an unknown value for the numShapes attribute (None), and that
     reading all the shapes will set the numShapes attribute.
     """
-    basename = "shapefiles/blockgroups"
-    shp = open(basename + ".shp", "rb")
-    dbf = open(basename + ".dbf", "rb")
-    with shapefile.Reader(shp=shp, dbf=dbf) as sf:
-        # numShapes should be unknown due to missing shx file
-        assert sf.numShapes is None
-        # numShapes should be set after reading all the shapes
-        shapes = sf.shapes()
-        assert sf.numShapes == len(shapes)
+    sf = blockgroups_reader_no_shx
+    # numShapes should be unknown due to missing shx file
+    assert sf.numShapes is None
+    # numShapes should be set after reading all the shapes
+    shapes = sf.shapes()
+    assert sf.numShapes == len(shapes)
 
 
-def test_reader_len():
+def test_reader_len(blockgroups_reader, blockgroups_records, blockgroups_shapes):
     """
     Assert that calling len() on reader is equal to length of
     all shapes and records.
     """
-    basename = "shapefiles/blockgroups"
-    with shapefile.Reader(basename) as sf:
-        assert len(sf) == len(sf.records()) == len(sf.shapes())
+    sf = blockgroups_reader
+    assert len(sf) == len(blockgroups_records) == len(blockgroups_shapes)
 
 
 def test_reader_len_not_loaded():
@@ -1154,46 +1093,42 @@ def test_reader_len_not_loaded():
         assert len(sf) == 0
 
 
-def test_reader_len_dbf_only():
+def test_reader_len_dbf_only(blockgroups_buffers, blockgroups_records):
     """
     Assert that calling len() on reader when reading a dbf file only,
     is equal to length of all records.
     """
-    basename = "shapefiles/blockgroups"
-    dbf = open(basename + ".dbf", "rb")
-    with shapefile.Reader(dbf=dbf) as sf:
-        assert len(sf) == len(sf.records())
+    with shapefile.Reader(dbf=blockgroups_buffers["dbf"]) as sf:
+        assert len(sf) == len(blockgroups_records)
 
 
-def test_reader_len_no_dbf():
+def test_reader_len_no_dbf(blockgroups_buffers, blockgroups_shapes):
     """
     Assert that calling len() on reader when dbf file is missing,
     is equal to length of all shapes.
     """
-    basename = "shapefiles/blockgroups"
-    shp = open(basename + ".shp", "rb")
-    shx = open(basename + ".shx", "rb")
+    shp = blockgroups_buffers["shp"]
+    shx = blockgroups_buffers["shx"]
     with shapefile.Reader(shp=shp, shx=shx) as sf:
-        assert len(sf) == len(sf.shapes())
+        assert len(sf) == len(blockgroups_shapes)
 
 
-def test_reader_len_no_dbf_shx():
+def test_reader_len_no_dbf_shx(blockgroups_buffers, blockgroups_shapes):
     """
     Assert that calling len() on reader when dbf and shx file is missing,
     is equal to length of all shapes.
     """
-    basename = "shapefiles/blockgroups"
-    shp = open(basename + ".shp", "rb")
-    with shapefile.Reader(shp=shp) as sf:
-        assert len(sf) == len(sf.shapes())
+    with shapefile.Reader(shp=blockgroups_buffers["shp"]) as sf:
+        assert len(sf) == len(blockgroups_shapes)
 
 
-def test_reader_corrupt_files():
+@pytest.fixture(name="corrupt_shapefile", scope="session")
+def fixture_corrupt_shapefile(tmp_path_factory):
     """
-    Assert that reader is able to handle corrupt files by
-    strictly going off the header information.
+    Writes a shapefile with junk byte data at the end of its files
+    once per session, returning its basename.
     """
-    basename = "shapefiles/test/corrupt_too_long"
+    basename = str(tmp_path_factory.mktemp("corrupt") / "corrupt_too_long")
 
     # write a shapefile with junk byte data at end of files
     with shapefile.Writer(basename) as w:
@@ -1206,8 +1141,16 @@ def test_reader_corrupt_files():
         w.dbf.write(b"12345")
         w.shp.write(b"12345")
 
+    return basename
+
+
+def test_reader_corrupt_files(corrupt_shapefile):
+    """
+    Assert that reader is able to handle corrupt files by
+    strictly going off the header information.
+    """
     # read the corrupt shapefile and assert that it reads correctly
-    with shapefile.Reader(basename) as sf:
+    with shapefile.Reader(corrupt_shapefile) as sf:
         # assert correct shapefile length metadata
         assert len(sf) == sf.numRecords == sf.numShapes == 10
         # assert that records are read without error
@@ -1226,7 +1169,7 @@ def test_reader_corrupt_files():
         assert (end - stopped) == 5
 
 
-def test_bboxfilter_shape():
+def test_bboxfilter_shape(blockgroups_reader):
     """
     Assert that applying the bbox filter to shape() correctly ignores the shape
     if it falls outside, and returns it if inside.
@@ -1235,67 +1178,57 @@ def test_bboxfilter_shape():
     outside = list(inside)
     outside[0] *= 10
     outside[2] *= 10
-    with shapefile.Reader("shapefiles/blockgroups") as sf:
-        assert sf.shape(0, bbox=inside) is not None
-        assert sf.shape(0, bbox=outside) is None
+    sf = blockgroups_reader
+    assert sf.shape(0, bbox=inside) is not None
+    assert sf.shape(0, bbox=outside) is None
 
 
-def test_bboxfilter_shapes():
+@pytest.mark.parametrize(
+    "method", ["shapes", "iterShapes", "shapeRecords", "iterShapeRecords"]
+)
+def test_bboxfilter_multiple(blockgroups_reader, blockgroups_shaperecords, method):
     """
-    Assert that applying the bbox filter to shapes() correctly ignores shapes
+    Assert that applying the bbox filter to shapes(), iterShapes(),
+    shapeRecords() and iterShapeRecords() correctly ignores shapes
     that fall outside, and returns those that fall inside.
     """
     bbox = [-122.4, 37.8, -122.35, 37.82]
-    with shapefile.Reader("shapefiles/blockgroups") as sf:
-        # apply bbox filter
-        shapes = sf.shapes(bbox=bbox)
-        # manually check bboxes
-        manual = shapefile.Shapes()
-        for shape in sf.iterShapes():
-            if shapefile.bbox_overlap(shape.bbox, bbox):
-                manual.append(shape)
-        # compare
-        assert len(shapes) == len(manual)
-        # check that they line up
-        for shape, man in zip(shapes, manual):
-            assert shape.oid == man.oid
-            assert shape.__geo_interface__ == man.__geo_interface__
-
-
-def test_bboxfilter_shapes_outside():
+    sf = blockgroups_reader
+    # apply bbox filter
+    results = list(getattr(sf, method)(bbox=bbox))
+    # manually check bboxes
+    manual = [
+        shaperec
+        for shaperec in blockgroups_shaperecords
+        if shapefile.bbox_overlap(shaperec.shape.bbox, bbox)
+    ]
+    if method in ("shapeRecords", "iterShapeRecords"):
+        # same records as manual
+        assert [shaperec.record for shaperec in results] == [
+            man.record for man in manual
+        ]
+        for shaperec in results:
+            assert shaperec.shape.oid == shaperec.record.oid
+        results = [shaperec.shape for shaperec in results]
+    # compare the oids first, then check the geometries line up
+    assert [shape.oid for shape in results] == [man.shape.oid for man in manual]
+    for shape, man in zip(results, manual):
+        assert shape.parts == man.shape.parts
+        assert shape.points == man.shape.points
+
+
+def test_bboxfilter_shapes_outside(blockgroups_reader):
     """
     Assert that applying the bbox filter to shapes() correctly returns
     no shapes when the bbox is outside the entire shapefile.
     """
     bbox = [-180, 89, -179, 90]
-    with shapefile.Reader("shapefiles/blockgroups") as sf:
-        shapes = sf.shapes(bbox=bbox)
-        assert len(shapes) == 0
+    sf = blockgroups_reader
+    shapes = sf.shapes(bbox=bbox)
+    assert len(shapes) == 0
 
 
-def test_bboxfilter_itershapes():
-    """
-    Assert that applying the bbox filter to iterShapes() correctly ignores shapes
-    that fall outside, and returns those that fall inside.
-    """
-    bbox = [-122.4, 37.8, -122.35, 37.82]
-    with shapefile.Reader("shapefiles/blockgroups") as sf:
-        # apply bbox filter
-        shapes = list(sf.iterShapes(bbox=bbox))
-        # manually check bboxes
-        manual = shapefile.Shapes()
-        for shape in sf.iterShapes():
-            if shapefile.bbox_overlap(shape.bbox, bbox):
-                manual.append(shape)
-        # compare
-        assert len(shapes) == len(manual)
-        # check that they line up
-        for shape, man in zip(shapes, manual):
-            assert shape.oid == man.oid
-            assert shape.__geo_interface__ == man.__geo_interface__
-
-
-def test_bboxfilter_shaperecord():
+def test_bboxfilter_shaperecord(blockgroups_reader):
     """
     Assert that applying the bbox filter to shapeRecord() correctly ignores the shape
     if it falls outside, and returns it if inside.
@@ -1304,310 +1237,184 @@ def test_bboxfilter_shaperecord():
     outside = list(inside)
     outside[0] *= 10
     outside[2] *= 10
-    with shapefile.Reader("shapefiles/blockgroups") as sf:
-        # inside
-        shaperec = sf.shapeRecord(0, bbox=inside)
-        assert shaperec is not None
-        assert shaperec.shape.oid == shaperec.record.oid
-        # outside
-        assert sf.shapeRecord(0, bbox=outside) is None
-
-
-def test_bboxfilter_shaperecords():
-    """
-    Assert that applying the bbox filter to shapeRecords() correctly ignores shapes
-    that fall outside, and returns those that fall inside.
-    """
-    bbox = [-122.4, 37.8, -122.35, 37.82]
-    with shapefile.Reader("shapefiles/blockgroups") as sf:
-        # apply bbox filter
-        shaperecs = sf.shapeRecords(bbox=bbox)
-        # manually check bboxes
-        manual = shapefile.ShapeRecords()
-        for shaperec in sf.iterShapeRecords():
-            if shapefile.bbox_overlap(shaperec.shape.bbox, bbox):
-                manual.append(shaperec)
-        # compare
-        assert len(shaperecs) == len(manual)
-        # check that they line up
-        for shaperec, man in zip(shaperecs, manual):
-            # oids
-            assert shaperec.shape.oid == shaperec.record.oid
-            # same shape as manual
-            assert shaperec.shape.oid == man.shape.oid
-            assert shaperec.shape.__geo_interface__ == man.shape.__geo_interface__
-            # same record as manual
-            assert shaperec.record.oid == man.record.oid
-            assert shaperec.record == man.record
-
-
-def test_bboxfilter_itershaperecords():
-    """
-    Assert that applying the bbox filter to iterShapeRecords() correctly ignores shapes
-    that fall outside, and returns those that fall inside.
-    """
-    bbox = [-122.4, 37.8, -122.35, 37.82]
-    with shapefile.Reader("shapefiles/blockgroups") as sf:
-        # apply bbox filter
-        shaperecs = list(sf.iterShapeRecords(bbox=bbox))
-        # manually check bboxes
-        manual = shapefile.ShapeRecords()
-        for shaperec in sf.iterShapeRecords():
-            if shapefile.bbox_overlap(shaperec.shape.bbox, bbox):
-                manual.append(shaperec)
-        # compare
-        assert len(shaperecs) == len(manual)
-        # check that they line up
-        for shaperec, man in zip(shaperecs, manual):
-            # oids
-            assert shaperec.shape.oid == shaperec.record.oid
-            # same shape as manual
-            assert shaperec.shape.oid == man.shape.oid
-            assert shaperec.shape.__geo_interface__ == man.shape.__geo_interface__
-            # same record as manual
-            assert shaperec.record.oid == man.record.oid
-            assert shaperec.record == man.record
+    sf = blockgroups_reader
+    # inside
+    shaperec = sf.shapeRecord(0, bbox=inside)
+    assert shaperec is not None
+    assert shaperec.shape.oid == shaperec.record.oid
+    # outside
+    assert sf.shapeRecord(0, bbox=outside) is None
 
 
-def test_shaperecords_shaperecord():
+def test_shaperecords_shaperecord(blockgroups_reader, blockgroups_shaperecords):
     """
     Assert that shapeRecords returns a list of
     ShapeRecord objects.
     Assert that shapeRecord returns a single
     ShapeRecord at the given index.
     """
-    with shapefile.Reader("shapefiles/blockgroups") as sf:
-        shaperecs = sf.shapeRecords()
-        shaperec = sf.shapeRecord(0)
-        should_match = shaperecs[0]
+    shaperec = blockgroups_reader.shapeRecord(0)
+    should_match = blockgroups_shaperecords[0]
 
-        # assert record is equal
-        assert shaperec.record == should_match.record
+    # assert record is equal
+    assert shaperec.record == should_match.record
 
-        # assert shape is equal
-        shaperec_json = shaperec.shape.__geo_interface__
-        should_match_json = should_match.shape.__geo_interface__
-        assert shaperec_json == should_match_json
+    # assert shape is equal
+    shaperec_json = shaperec.shape.__geo_interface__
+    should_match_json = should_match.shape.__geo_interface__
+    assert shaperec_json == should_match_json
 
 
-def test_shaperecord_shape():
+def test_shaperecord_shape(blockgroups_reader):
     """
     Assert that a ShapeRecord object has a shape
     attribute that contains shape data.
     """
-    with shapefile.Reader("shapefiles/blockgroups") as sf:
-        shaperec = sf.shapeRecord(3)
-        shape = shaperec.shape
-        point = shape.points[0]
-        assert len(point) == 2
+    sf = blockgroups_reader
+    shaperec = sf.shapeRecord(3)
+    shape = shaperec.shape
+    point = shape.points[0]
+    assert len(point) == 2
 
 
-def test_shaperecord_record():
+def test_shaperecord_record(blockgroups_reader):
     """
     Assert that a ShapeRecord object has a record
     attribute that contains record data.
     """
-    with shapefile.Reader("shapefiles/blockgroups") as sf:
-        shaperec = sf.shapeRecord(3)
-        record = shaperec.record
-
-        assert record[1:3] == ["060750601001", 4715]
-
-
-def test_write_field_name_limit(tmpdir):
-    """
-    Abc...
-    """
-    filename = tmpdir.join("test.shp").strpath
-    with shapefile.Writer(filename) as writer:
-        writer.field("a" * 5, "C")  # many under length limit
-        writer.field("a" * 9, "C")  # 1 under length limit
-        writer.field("a" * 10, "C")  # at length limit
-        writer.field("a" * 11, "C")  # 1 over length limit
-        writer.field("a" * 20, "C")  # many over limit
-
-    with shapefile.Reader(filename) as reader:
-        fields = reader.fields[1:]
-        assert len(fields[0][0]) == 5
-        assert len(fields[1][0]) == 9
-        assert len(fields[2][0]) == 10
-        assert len(fields[3][0]) == 10
-        assert len(fields[4][0]) == 10
-
-
-def test_write_shp_only(tmpdir):
-    """
-    Assert that specifying just the
-    shp argument to the shapefile writer
-    creates just a shp file.
-    """
-    filename = tmpdir.join("test").strpath
-    with shapefile.Writer(shp=filename + ".shp") as writer:
-        writer.point(1, 1)
-    assert writer.shp and not writer.shx and not writer.dbf
-    assert writer.shpNum == 1
-    assert len(writer) == 1
-    assert writer.shp.closed is True
-
-    # assert test.shp exists
-    assert os.path.exists(filename + ".shp")
-
-    # test that can read shapes
-    with shapefile.Reader(shp=filename + ".shp") as reader:
-        assert reader.shp and not reader.shx and not reader.dbf
-        assert (reader.numRecords, reader.numShapes) == (
-            None,
-            None,
-        )  # numShapes is unknown in the absence of shx file
-        assert len(reader.shapes()) == 1
-
-    # assert test.shx does not exist
-    assert not os.path.exists(filename + ".shx")
-
-    # assert test.dbf does not exist
-    assert not os.path.exists(filename + ".dbf")
-
-
-def test_write_shp_shx_only(tmpdir):
-    """
-    Assert that specifying just the shp and
-    shx argument to the shapefile writer
-    creates just a shp and shx file.
-    """
-    filename = tmpdir.join("test").strpath
-    with shapefile.Writer(shp=filename + ".shp", shx=filename + ".shx") as writer:
-        writer.point(1, 1)
-    assert writer.shp and writer.shx and not writer.dbf
-    assert writer.shpNum == 1
-    assert len(writer) == 1
-    assert writer.shp.closed is writer.shx.closed is True
-
-    # assert test.shp exists
-    assert os.path.exists(filename + ".shp")
-
-    # assert test.shx exists
-    assert os.path.exists(filename + ".shx")
-
-    # test that can read shapes and offsets
-    with shapefile.Reader(shp=filename + ".shp", shx=filename + ".shx") as reader:
-        assert reader.shp and reader.shx and not reader.dbf
-        assert (reader.numRecords, reader.numShapes) == (None, 1)
-        reader.shape(0)  # trigger reading of shx offsets
-        assert len(reader._offsets) == 1
-        assert len(reader.shapes()) == 1
-
-    # assert test.dbf does not exist
-    assert not os.path.exists(filename + ".dbf")
-
-
-def test_write_shp_dbf_only(tmpdir):
-    """
-    Assert that specifying just the
-    shp and dbf argument to the shapefile writer
-    creates just a shp and dbf file.
-    """
-    filename = tmpdir.join("test").strpath
-    with shapefile.Writer(shp=filename + ".shp", dbf=filename + ".dbf") as writer:
-        writer.field("field1", "C")  # required to create a valid dbf file
-        writer.record("value")
-        writer.point(1, 1)
-    assert writer.shp and not writer.shx and writer.dbf
-    assert writer.shpNum == writer.recNum == 1
+    sf = blockgroups_reader
+    shaperec = sf.shapeRecord(3)
+    record = shaperec.record
+
+    assert record[1:3] == ["060750601001", 4715]
+
+
+field_name_lengths = (5, 9, 10, 11, 20)
+
+
+@pytest.fixture(name="written_field_names", scope="module")
+def fixture_written_field_names():
+    """
+    Writes a field with a name of each of the field_name_lengths once
+    per module, returning the field names as read back, keyed by the
+    length of the name they were written with.
+    """
+    files = in_memory_files()
+    with shapefile.Writer(**files) as writer:
+        for length in field_name_lengths:
+            writer.field("a" * length, "C")
+
+    with shapefile.Reader(**files) as reader:
+        names = [field[0] for field in reader.fields[1:]]
+    return dict(zip(field_name_lengths, names))
+
+
+@pytest.mark.parametrize(
+    "length,expected",
+    [(5, 5), (9, 9), (10, 10), (11, 10), (20, 10)],
+    ids=[
+        "many_under_limit",
+        "one_under_limit",
+        "at_limit",
+        "one_over_limit",
+        "many_over_limit",
+    ],
+)
+def test_write_field_name_limit(written_field_names, length, expected):
+    """
+    Assert that field names longer than the dbf limit
+    of 10 characters are truncated when written.
+    """
+    assert len(written_field_names[length]) == expected
+
+
+@pytest.mark.parametrize(
+    "exts",
+    [("shp",), ("shp", "shx"), ("shp", "dbf"), ("dbf",)],
+    ids=["shp_only", "shp_shx_only", "shp_dbf_only", "dbf_only"],
+)
+def test_write_only(tmp_path, exts):
+    """
+    Assert that specifying just some of the
+    shp, shx and dbf arguments to the shapefile writer
+    creates just those files, and that they can be read.
+    """
+    filename = str(tmp_path / "test")
+    kwargs = dict((ext, filename + "." + ext) for ext in exts)
+    with shapefile.Writer(**kwargs) as writer:
+        if "dbf" in exts:
+            writer.field("field1", "C")  # required to create a valid dbf file
+            writer.record("value")
+        if "shp" in exts:
+            writer.point(1, 1)
+    for ext in ("shp", "shx", "dbf"):
+        assert bool(getattr(writer, ext)) is (ext in exts)
+    if "shp" in exts:
+        assert writer.shpNum == 1
+    if "dbf" in exts:
+        assert writer.recNum == 1
     assert len(writer) == 1
-    assert writer.shp.closed is writer.dbf.closed is True
+    for ext in exts:
+        assert getattr(writer, ext).closed is True
 
-    # assert test.shp exists
-    assert os.path.exists(filename + ".shp")
+    # assert only the given files exist
+    assert set(os.listdir(str(tmp_path))) == set("test." + ext for ext in exts)
 
-    # assert test.dbf exists
-    assert os.path.exists(filename + ".dbf")
-
-    # test that can read records and shapes
-    with shapefile.Reader(shp=filename + ".shp", dbf=filename + ".dbf") as reader:
-        assert reader.shp and not reader.shx and reader.dbf
+    # test that can read records, shapes and offsets
+    with shapefile.Reader(**kwargs) as reader:
+        for ext in ("shp", "shx", "dbf"):
+            assert bool(getattr(reader, ext)) is (ext in exts)
+        # numShapes is unknown in the absence of shx file
         assert (reader.numRecords, reader.numShapes) == (
-            1,
-            None,
-        )  # numShapes is unknown in the absence of shx file
-        assert len(reader.records()) == 1
-        assert len(reader.shapes()) == 1
-
-    # assert test.shx does not exist
-    assert not os.path.exists(filename + ".shx")
-
-
-def test_write_dbf_only(tmpdir):
-    """
-    Assert that specifying just the
-    dbf argument to the shapefile writer
-    creates just a dbf file.
-    """
-    filename = tmpdir.join("test").strpath
-    with shapefile.Writer(dbf=filename + ".dbf") as writer:
-        writer.field("field1", "C")  # required to create a valid dbf file
-        writer.record("value")
-    assert not writer.shp and not writer.shx and writer.dbf
-    assert writer.recNum == 1
-    assert len(writer) == 1
-    assert writer.dbf.closed is True
-
-    # assert test.dbf exists
-    assert os.path.exists(filename + ".dbf")
-
-    # test that can read records
-    with shapefile.Reader(dbf=filename + ".dbf") as reader:
-        assert not writer.shp and not writer.shx and writer.dbf
-        assert (reader.numRecords, reader.numShapes) == (1, None)
-        assert len(reader.records()) == 1
-
-    # assert test.shp does not exist
-    assert not os.path.exists(filename + ".shp")
+            1 if "dbf" in exts else None,
+            1 if "shx" in exts else None,
+        )
+        if "shx" in exts:
+            reader.shape(0)  # trigger reading of shx offsets
+            assert len(reader._offsets) == 1
+        if "dbf" in exts:
+            assert len(reader.records()) == 1
+        if "shp" in exts:
+            assert len(reader.shapes()) == 1
 
-    # assert test.shx does not exist
-    assert not os.path.exists(filename + ".shx")
 
-
-def test_write_default_shp_shx_dbf(tmpdir):
+def test_write_default_shp_shx_dbf(tmp_path):
     """
     Assert that creating the shapefile writer without
     specifying the shp, shx, or dbf arguments
     creates a set of shp, shx, and dbf files.
     """
-    filename = tmpdir.join("test").strpath
+    filename = str(tmp_path / "test")
     with shapefile.Writer(filename) as writer:
         writer.field("field1", "C")  # required to create a valid dbf file
         writer.record("value")
         writer.null()
 
     # assert shp, shx, dbf files exist
-    assert os.path.exists(filename + ".shp")
-    assert os.path.exists(filename + ".shx")
-    assert os.path.exists(filename + ".dbf")
+    assert set(os.listdir(str(tmp_path))) == {"test.shp", "test.shx", "test.dbf"}
 
 
-def test_write_pathlike(tmpdir):
+def test_write_pathlike(tmp_path):
     """
     Assert that path-like objects can be written.
     Similar to test_write_default_shp_shx_dbf.
     """
-    filename = tmpdir.join("test")
+    filename = tmp_path / "test"
     assert not isinstance(filename, str)
     with shapefile.Writer(filename) as writer:
         writer.field("field1", "C")
         writer.record("value")
         writer.null()
-    assert (filename + ".shp").ensure()
-    assert (filename + ".shx").ensure()
-    assert (filename + ".dbf").ensure()
+    assert set(os.listdir(str(tmp_path))) == {"test.shp", "test.shx", "test.dbf"}
 
 
-def test_write_filelike(tmpdir):
+def test_write_filelike():
     """
     Assert that file-like objects are written correctly.
     """
-    shp = open(tmpdir.join("test.shp").strpath, mode="wb+")
-    shx = open(tmpdir.join("test.shx").strpath, mode="wb+")
-    dbf = open(tmpdir.join("test.dbf").strpath, mode="wb+")
+    shp = io.BytesIO()
+    shx = io.BytesIO()
+    dbf = io.BytesIO()
     with shapefile.Writer(shx=shx, dbf=dbf, shp=shp) as writer:
         writer.field("field1", "C")  # required to create a valid dbf file
         writer.record("value")
@@ -1619,13 +1426,13 @@ def test_write_filelike(tmpdir):
         assert reader.shape(0).shapeType == shapefile.NULL
 
 
-def test_write_close_path(tmpdir):
+def test_write_close_path(tmp_path):
     """
     Assert that the Writer close() method
     closes the shp, shx, and dbf files
     on exit, if given paths.
     """
-    sf = shapefile.Writer(tmpdir.join("test"))
+    sf = shapefile.Writer(tmp_path / "test")
     sf.field("field1", "C")  # required to create a valid dbf file
     sf.record("value")
     sf.null()
@@ -1636,20 +1443,20 @@ def test_write_close_path(tmpdir):
     assert sf.shx.closed is True
 
     # test that opens and reads correctly after
-    with shapefile.Reader(tmpdir.join("test")) as reader:
+    with shapefile.Reader(tmp_path / "test") as reader:
         assert len(reader) == 1
         assert reader.shape(0).shapeType == shapefile.NULL
 
 
-def test_write_close_filelike(tmpdir):
+def test_write_close_filelike():
     """
     Assert that the Writer close() method
     leaves the shp, shx, and dbf files open
     on exit, if given filelike objects.
     """
-    shp = open(tmpdir.join("test.shp").strpath, mode="wb+")
-    shx = open(tmpdir.join("test.shx").strpath, mode="wb+")
-    dbf = open(tmpdir.join("test.dbf").strpath, mode="wb+")
+    shp = io.BytesIO()
+    shx = io.BytesIO()
+    dbf = io.BytesIO()
     sf = shapefile.Writer(shx=shx, dbf=dbf, shp=shp)
     sf.field("field1", "C")  # required to create a valid dbf file
     sf.record("value")
@@ -1666,13 +1473,13 @@ def test_write_close_filelike(tmpdir):
         assert reader.shape(0).shapeType == shapefile.NULL
 
 
-def test_write_context_path(tmpdir):
+def test_write_context_path(tmp_path):
     """
     Assert that the Writer context manager
     closes the shp, shx, and dbf files
     on exit, if given paths.
     """
-    with shapefile.Writer(tmpdir.join("test")) as sf:
+    with shapefile.Writer(tmp_path / "test") as sf:
         sf.field("field1", "C")  # required to create a valid dbf file
         sf.record("value")
         sf.null()
@@ -1682,20 +1489,20 @@ def test_write_context_path(tmpdir):
     assert sf.shx.closed is True
 
     # test that opens and reads correctly after
-    with shapefile.Reader(tmpdir.join("test")) as reader:
+    with shapefile.Reader(tmp_path / "test") as reader:
         assert len(reader) == 1
         assert reader.shape(0).shapeType == shapefile.NULL
 
 
-def test_write_context_filelike(tmpdir):
+def test_write_context_filelike():
     """
     Assert that the Writer context manager
     leaves the shp, shx, and dbf files open
     on exit, if given filelike objects.
     """
-    shp = open(tmpdir.join("test.shp").strpath, mode="wb+")
-    shx = open(tmpdir.join("test.shx").strpath, mode="wb+")
-    dbf = open(tmpdir.join("test.dbf").strpath, mode="wb+")
+    shp = io.BytesIO()
+    shx = io.BytesIO()
+    dbf = io.BytesIO()
     with shapefile.Writer(shx=shx, dbf=dbf, shp=shp) as sf:
         sf.field("field1", "C")  # required to create a valid dbf file
         sf.record("value")
@@ -1711,41 +1518,47 @@ def test_write_context_filelike(tmpdir):
         assert reader.shape(0).shapeType == shapefile.NULL
 
 
-def test_write_shapefile_extension_ignored(tmpdir):
+def test_write_shapefile_extension_ignored(tmp_path):
     """
     Assert that the filename's extension is
     ignored when creating a shapefile.
     """
     base = "test"
     ext = ".abc"
-    filename = tmpdir.join(base + ext).strpath
+    filename = str(tmp_path / (base + ext))
     with shapefile.Writer(filename) as writer:
         writer.field("field1", "C")  # required to create a valid dbf file
 
-    # assert shp, shx, dbf files exist
-    basepath = tmpdir.join(base).strpath
-    assert os.path.exists(basepath + ".shp")
-    assert os.path.exists(basepath + ".shx")
-    assert os.path.exists(basepath + ".dbf")
+    # assert shp, shx, dbf files exist, and test.abc does not
+    assert set(os.listdir(str(tmp_path))) == {
+        base + ".shp",
+        base + ".shx",
+        base + ".dbf",
+    }
 
-    # assert test.abc does not exist
-    assert not os.path.exists(basepath + ext)
+
+@pytest.fixture(name="four_field_writer")
+def fixture_four_field_writer():
+    """
+    A Writer with four character fields named "one" to "four" and
+    autoBalance turned on, writing to in memory files that are
+    returned together with it. The tests close the writer.
+    """
+    files = in_memory_files()
+    writer = shapefile.Writer(**files)
+    writer.autoBalance = True
+    for name in ("one", "two", "three", "four"):
+        writer.field(name, "C")
+    return writer, files
 
 
-def test_write_record(tmpdir):
+def test_write_record(four_field_writer):
     """
     Test that .record() correctly writes a record using either a list of *args
     or a dict of **kwargs.
     """
-    filename = tmpdir.join("test.shp").strpath
-    with shapefile.Writer(filename) as writer:
-        writer.autoBalance = True
-
-        writer.field("one", "C")
-        writer.field("two", "C")
-        writer.field("three", "C")
-        writer.field("four", "C")
-
+    writer, files = four_field_writer
+    with writer:
         values = ["one", "two", "three", "four"]
         writer.record(*values)
         writer.record(*values)
@@ -1754,25 +1567,18 @@ def test_write_record(tmpdir):
         writer.record(**valuedict)
         writer.record(**valuedict)
 
-    with shapefile.Reader(filename) as reader:
+    with shapefile.Reader(**files) as reader:
         for record in reader.iterRecords():
             assert record == values
 
 
-def test_write_partial_record(tmpdir):
+def test_write_partial_record(four_field_writer):
     """
     Test that .record() correctly writes a partial record (given only some of the values)
     using either a list of *args or a dict of **kwargs. Should fill in the gaps.
     """
-    filename = tmpdir.join("test.shp").strpath
-    with shapefile.Writer(filename) as writer:
-        writer.autoBalance = True
-
-        writer.field("one", "C")
-        writer.field("two", "C")
-        writer.field("three", "C")
-        writer.field("four", "C")
-
+    writer, files = four_field_writer
+    with writer:
         values = ["one", "two"]
         writer.record(*values)
         writer.record(*values)
@@ -1781,21 +1587,35 @@ def test_write_partial_record(tmpdir):
         writer.record(**valuedict)
         writer.record(**valuedict)
 
-    with shapefile.Reader(filename) as reader:
+    with shapefile.Reader(**files) as reader:
         expected = list(values)
         expected.extend(["", ""])
-        for record in reader.iterRecords():
-            assert record == expected
+        assert list(reader.iterRecords()) == [expected] * 4
+
+
+def test_write_record_bytes():
+    """
+    Test that .record() writes already encoded bytes and bytearray
+    values to character fields without re-encoding them.
+    """
+    files = in_memory_files()
+    with shapefile.Writer(encoding="latin1", **files) as writer:
+        writer.autoBalance = True
+        writer.field("one", "C")
+        writer.record(b"caf\xe9")
+        writer.record(bytearray(b"caf\xe9"))
 
-        assert len(reader.records()) == 4
+    with shapefile.Reader(encoding="latin1", **files) as reader:
+        for record in reader.iterRecords():
+            assert record == [b"caf\xe9".decode("latin1")]
 
 
-def test_write_geojson(tmpdir):
+def test_write_geojson():
     """
     Assert that the output of geo interface can be written to json.
     """
-    filename = tmpdir.join("test").strpath
-    with shapefile.Writer(filename) as w:
+    files = in_memory_files()
+    with shapefile.Writer(**files) as w:
         w.field("TEXT", "C")
         w.field("NUMBER", "N")
         w.field("DATE", "D")
@@ -1804,34 +1624,30 @@ def test_write_geojson(tmpdir):
         w.record("text", 123, "19980130")
         w.record("text", 123, "-9999999")  # faulty date
         w.record(None, None, None)
-        w.null()
-        w.null()
-        w.null()
-        w.null()
-        w.null()
+        for _ in range(5):
+            w.null()
 
-    with shapefile.Reader(filename) as r:
-        for feat in r:
-            assert json.dumps(feat.__geo_interface__)
-        assert json.dumps(r.shapeRecords().__geo_interface__)
-        assert json.dumps(r.__geo_interface__)
+    with shapefile.Reader(**files) as r:
+        assert_json_serializable([feat.__geo_interface__ for feat in r])
+        assert_json_serializable(r.__geo_interface__)
 
 
-shape_types = [
-    k for k in shapefile.SHAPETYPE_LOOKUP.keys() if k != 31
-]  # exclude multipatch
+shape_types = tuple(
+    k for k in shapefile.SHAPETYPE_LOOKUP if k != shapefile.MULTIPATCH
+)  # exclude multipatch
+shape_type_ids = [shapefile.SHAPETYPE_LOOKUP[k] for k in shape_types]
 
 
-@pytest.mark.parametrize("shape_type", shape_types)
-def test_write_empty_shapefile(tmpdir, shape_type):
+@pytest.mark.parametrize("shape_type", shape_types, ids=shape_type_ids)
+def test_write_empty_shapefile(shape_type):
     """
     Assert that can write an empty shapefile, for all different shape types.
     """
-    filename = tmpdir.join("test").strpath
-    with shapefile.Writer(filename, shapeType=shape_type) as w:
+    files = in_memory_files()
+    with shapefile.Writer(shapeType=shape_type, **files) as w:
         w.field("field1", "C")  # required to create a valid dbf file
 
-    with shapefile.Reader(filename) as r:
+    with shapefile.Reader(**files) as r:
         # test correct shape type
         assert r.shapeType == shape_type
         # test length 0